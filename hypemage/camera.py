@@ -28,6 +28,7 @@ Usage:
 
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache
 from pathlib import Path
 import time
 import cv2
@@ -49,13 +50,25 @@ except ImportError as e:
     _HAS_PICAMERA = False
     logger.warning(f"Picamera2 not available: {e}")
 
+# simplejpeg talks to libjpeg-turbo directly and is noticeably faster than
+# cv2.imencode on the Pi; fall back to OpenCV if it isn't installed
+try:
+    import simplejpeg
+    _HAS_SIMPLEJPEG = True
+except ImportError:
+    _HAS_SIMPLEJPEG = False
+
+
+# Radians -> degrees factor for the per-detection angle math
+_RAD_TO_DEG = 180.0 / math.pi
+
 
 class CameraInitializationError(Exception):
     """Raised when camera initialization fails critically"""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BallDetectionResult:
     """Ball detection result data"""
     detected: bool = False
@@ -73,7 +86,7 @@ class BallDetectionResult:
     in_close_zone: bool = False  # True if detected in the extra-sensitive close ball zone (dribbler area)
 
 
-@dataclass
+@dataclass(slots=True)
 class GoalDetectionResult:
     """Single goal detection result"""
     detected: bool = False
@@ -88,7 +101,7 @@ class GoalDetectionResult:
     angle: float = 0.0  # Angle from forward direction in degrees (-180 to 180)
     is_centered_horizontally: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class VisionData:
     """Complete vision data output from camera process"""
     timestamp: float
@@ -265,8 +278,14 @@ class CameraProcess:
                 logger.warning(f"Failed to set camera focus: {e}")
     
     def _capture_picamera(self):
-        """Capture frame from Picamera2"""
-        return self.picam2.capture_array()
+        """
+        Capture frame from Picamera2
+        
+        libcamera's "RGB888" format is stored B,G,R in memory, so the array
+        is already in OpenCV's BGR order and goes straight to detection and
+        encode_jpeg() without a cvtColor pass or copy.
+        """
+        return self.picam2.capture_array("main")
     
     def _capture_opencv(self):
         """Capture frame from OpenCV VideoCapture"""
@@ -655,12 +674,17 @@ class CameraProcess:
         
         return (x1, y1, x2, y2)
     
-    def detect_ball(self, frame) -> BallDetectionResult:
+    def detect_ball(self, frame, roi: Optional[Tuple[int, int, int, int]] = None) -> BallDetectionResult:
         """
         Detect orange ball in the frame using HSV color filtering
         
         Args:
             frame: Input frame from camera (BGR from Picamera2) - full frame
+            roi: Optional (x1, y1, x2, y2) search window in full frame coordinates,
+                 e.g. around where the ball was last seen. Only this region is
+                 converted/thresholded, which is far less memory traffic than
+                 the whole frame. The mirror mask and close zone still use the
+                 full frame.
             
         Returns:
             BallDetectionResult with detection info (coordinates in full frame)
@@ -671,29 +695,44 @@ class CameraProcess:
         # First, try close zone detection (extra sensitive for dribbler area)
         close_zone_result = self._detect_ball_in_close_zone(frame)
         if close_zone_result.detected:
-            logger.info(f"Ball detected in CLOSE ZONE: pos=({close_zone_result.center_x}, {close_zone_result.center_y}) "
-                       f"radius={close_zone_result.radius} distance={close_zone_result.distance:.1f}px angle={close_zone_result.angle:.1f}°")
+            logger.debug("Ball detected in CLOSE ZONE: pos=(%d, %d) radius=%d distance=%.1fpx angle=%.1f°",
+                         close_zone_result.center_x, close_zone_result.center_y,
+                         close_zone_result.radius, close_zone_result.distance, close_zone_result.angle)
             return close_zone_result
         
-        # Apply mask to full frame (no cropping)
-        masked_frame = self.crop_to_mirror(frame)
+        # Search region (full frame unless an ROI was given)
+        if roi is not None:
+            x1, y1, x2, y2 = roi
+            region = frame[y1:y2, x1:x2]
+            region_mask = self.mirror_mask[y1:y2, x1:x2] if self.mirror_mask is not None else None
+            if region.size == 0:
+                return BallDetectionResult(detected=False)
+        else:
+            x1 = y1 = 0
+            region = frame
+            region_mask = self.mirror_mask
         
         # Convert to HSV (Picamera2 returns BGR format)
-        hsv = cv2.cvtColor(masked_frame, cv2.COLOR_BGR2HSV)
+        hsv = cv2.cvtColor(region, cv2.COLOR_BGR2HSV)
         
-        # Create color mask for orange ball
+        # Create color mask for orange ball, restricted to the mirror area
+        # (masking the single-channel result is cheaper than masking BGR first)
         mask = cv2.inRange(hsv, self.lower_orange, self.upper_orange)
+        if region_mask is not None:
+            mask = cv2.bitwise_and(mask, region_mask)
         
-        # Find contours in the masked region
-        contours, _ = cv2.findContours(mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+        # Find contours in the masked region (offset back to full frame coordinates)
+        contours, _ = cv2.findContours(mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE,
+                                       offset=(x1, y1))
         
-        logger.debug(f"Ball detection: Found {len(contours)} contours")
+        logger.debug("Ball detection: Found %d contours", len(contours))
         
         # Filter contours by area (only max area to avoid huge objects)
         filtered_contours = [x for x in contours if 
                            cv2.contourArea(x) < self.max_ball_area]
         
-        logger.debug(f"Ball detection: {len(filtered_contours)} contours after max area filter (max_area={self.max_ball_area})")
+        logger.debug("Ball detection: %d contours after max area filter (max_area=%s)",
+                     len(filtered_contours), self.max_ball_area)
         
         if not filtered_contours:
             logger.debug("Ball detection: No contours found after filtering")
@@ -706,12 +745,12 @@ class CameraProcess:
         center_y = int(y)
         radius = int(radius)
         
-        logger.debug(f"Ball detection: Largest contour at ({center_x}, {center_y}) with radius {radius}")
+        logger.debug("Ball detection: Largest contour at (%d, %d) with radius %d", center_x, center_y, radius)
         
         # Filter by minimum radius (more intuitive than area)
         min_radius = 2  # Minimum 2 pixel radius
         if radius < min_radius:
-            logger.debug(f"Ball detection: Radius {radius} below minimum {min_radius}, rejecting")
+            logger.debug("Ball detection: Radius %d below minimum %d, rejecting", radius, min_radius)
             return BallDetectionResult(detected=False)
         
         # Calculate proximity info
@@ -731,7 +770,7 @@ class CameraProcess:
         # Camera's "up" direction (-Y) is 180° opposite to robot's forward direction
         # Result: 0° = robot forward, +90° = left (counterclockwise), -90° = right (clockwise), ±180° = backward
         angle_rad = math.atan2(dx, -dy)  # atan2(x, -y) gives angle from upward direction
-        angle = math.degrees(angle_rad)  # Convert to degrees (-180 to 180)
+        angle = angle_rad * _RAD_TO_DEG  # Convert to degrees (-180 to 180)
         
         # Add 180° offset to align camera orientation with robot's forward direction
         angle = angle + 180.0
@@ -742,8 +781,10 @@ class CameraProcess:
         is_close = ball_area >= self.proximity_threshold
         is_centered = abs(horizontal_error) <= self.angle_tolerance
         
-        logger.info(f"Ball detected: pos=({center_x}, {center_y}) radius={radius} area={ball_area:.1f} "
-                   f"distance={distance:.1f}px angle={angle:.1f}° close={is_close} centered={is_centered} h_err={horizontal_error:.2f}")
+        # Per-frame trace: lazy %-formatting, only rendered when DEBUG is on
+        logger.debug("Ball detected: pos=(%d, %d) radius=%d area=%.1f distance=%.1fpx angle=%.1f° "
+                     "close=%s centered=%s h_err=%.2f", center_x, center_y, radius, ball_area,
+                     distance, angle, is_close, is_centered, horizontal_error)
         
         return BallDetectionResult(
             detected=True,
@@ -839,7 +880,7 @@ class CameraProcess:
         # Calculate angle with 180° offset for robot's forward direction
         # Standard convention: positive = counterclockwise (left), negative = clockwise (right)
         angle_rad = math.atan2(dx, -dy)
-        angle = math.degrees(angle_rad)
+        angle = angle_rad * _RAD_TO_DEG
         
         # Add 180° offset to align camera orientation with robot's forward direction
         angle = angle + 180.0
@@ -850,8 +891,8 @@ class CameraProcess:
         is_close = ball_area >= self.proximity_threshold
         is_centered = abs(horizontal_error) <= self.angle_tolerance
         
-        logger.debug(f"Close zone detection: pos=({center_x}, {center_y}) radius={radius} "
-                    f"distance={distance:.1f}px angle={angle:.1f}°")
+        logger.debug("Close zone detection: pos=(%d, %d) radius=%d distance=%.1fpx angle=%.1f°",
+                     center_x, center_y, radius, distance, angle)
         
         return BallDetectionResult(
             detected=True,
@@ -946,7 +987,7 @@ class CameraProcess:
         # Camera's "up" direction (-Y) is 180° opposite to robot's forward direction
         # Result: 0° = robot forward, +90° = left, -90° = right, ±180° = backward
         angle_rad = math.atan2(dx, -dy)  # atan2(x, -y) gives angle from upward direction
-        angle = math.degrees(angle_rad)  # Convert to degrees (-180 to 180)
+        angle = angle_rad * _RAD_TO_DEG  # Convert to degrees (-180 to 180)
         
         # Add 180° offset to align camera orientation with robot's forward direction
         angle = angle + 180.0
@@ -1005,15 +1046,22 @@ def load_camera_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         return {}
 
 
-def camera_start(cmd_q, out_q, stop_evt, config=None):
+def camera_start(cmd_q, out_q, stop_evt, config=None, detect_ball_evt=None, active_evt=None):
     """
     Entry point for camera process - runs continuously and processes commands
     
     Args:
         cmd_q: Queue for incoming commands from main process
-        out_q: Queue for outgoing vision data to main process
+        out_q: Queue or VisionRing for outgoing vision data to main process
+               (a VisionRing carries raw_frame only if built with frame_shape,
+               and never frame_bytes)
         stop_evt: Event to signal shutdown
         config: Optional camera configuration dict
+        detect_ball_evt: Optional Event - while set, only the ball is detected
+                         (skips goal detection; cheaper than a command per frame)
+        active_evt: Optional Event - while clear, the process stays up (camera
+                    open) but doesn't capture. Lets the owner switch vision on
+                    and off without paying process start + sensor init each time.
     
     Commands (dict messages on cmd_q):
         {'type': 'detect_ball'} - detect ball only
@@ -1032,10 +1080,15 @@ def camera_start(cmd_q, out_q, stop_evt, config=None):
     
     try:
         while not stop_evt.is_set():
-            # Process commands
+            # Idle until activated (timeout so stop_evt is still noticed)
+            if active_evt is not None and not active_evt.wait(timeout=0.1):
+                continue
+            
+            # Process commands - a non-blocking check: commands are rare, and a
+            # blocking get here would hold every frame back by its timeout
             cmd = None
             try:
-                cmd = cmd_q.get(timeout=0.01)
+                cmd = cmd_q.get_nowait()
             except Exception:
                 pass
             
@@ -1094,12 +1147,11 @@ def camera_start(cmd_q, out_q, stop_evt, config=None):
                     compress = cmd.get('compress', True)
                     if compress:
                         # Compress to JPEG (frame is already BGR)
-                        ok, jpg = cv2.imencode('.jpg', frame, 
-                                              [int(cv2.IMWRITE_JPEG_QUALITY), 60])
-                        if ok:
-                            vision_data.frame_bytes = jpg.tobytes()
+                        vision_data.frame_bytes = encode_jpeg(frame, quality=60)
                     else:
                         vision_data.raw_frame = frame
+            elif detect_ball_evt is not None and detect_ball_evt.is_set():
+                vision_data.ball = camera.detect_ball(frame)
             else:
                 # Default: detect all
                 vision_data.ball = camera.detect_ball(frame)
@@ -1114,15 +1166,15 @@ def camera_start(cmd_q, out_q, stop_evt, config=None):
                 # Queue full, drop oldest or skip
                 pass
             
-            # Small sleep to avoid hot loop
-            time.sleep(0.01)
+            # No sleep here: capture_frame() blocks until the next frame, so
+            # the loop is paced by the sensor rather than by a fixed delay
     
     finally:
         camera.stop()
 
 
 # Convenience function for simple usage
-def start(cmd_q, out_q, stop_evt=None, config=None):
+def start(cmd_q, out_q, stop_evt=None, config=None, detect_ball_evt=None, active_evt=None):
     """
     Convenience wrapper that matches the camera_example.py pattern
     
@@ -1138,7 +1190,40 @@ def start(cmd_q, out_q, stop_evt=None, config=None):
         from multiprocessing import Event
         stop_evt = Event()
     
-    camera_start(cmd_q, out_q, stop_evt, config)
+    camera_start(cmd_q, out_q, stop_evt, config, detect_ball_evt, active_evt)
+
+
+def _goal_overlay_box(goal: GoalDetectionResult, frame_width: int,
+                      frame_height: int) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Compute the on-screen rectangle for a goal detection, clamped to the frame
+    
+    Returns:
+        (x, y, w, h) or None if the clamped box is empty
+    """
+    width = int(goal.width)
+    height = int(goal.height)
+    x = int(goal.center_x) - width // 2
+    y = int(goal.center_y) - height // 2
+    
+    # Bounds check and clamp
+    x = max(0, min(x, frame_width - 1))
+    y = max(0, min(y, frame_height - 1))
+    w = min(width, frame_width - x)
+    h = min(height, frame_height - y)
+    
+    if w > 0 and h > 0:
+        return (x, y, w, h)
+    return None
+
+
+@lru_cache(maxsize=8)
+def _centered_text_origin(center_x: int, center_y: int, text: str,
+                          font_scale: float, thickness: int) -> Tuple[int, int]:
+    """Origin that centers static overlay text on a point (cached per frame size)"""
+    (text_width, text_height), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX,
+                                                   font_scale, thickness)
+    return (center_x - text_width // 2, center_y + text_height // 2)
 
 
 def add_debug_overlays(frame: np.ndarray, vision_data: VisionData) -> np.ndarray:
@@ -1195,57 +1280,23 @@ def add_debug_overlays(frame: np.ndarray, vision_data: VisionData) -> np.ndarray
             cv2.putText(display_frame, label, (text_x, text_y),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 165, 255), 2)
     
-    # Draw blue goal detection
-    if vision_data.blue_goal.detected:
-        center_x = int(vision_data.blue_goal.center_x)
-        center_y = int(vision_data.blue_goal.center_y)
-        width = int(vision_data.blue_goal.width)
-        height = int(vision_data.blue_goal.height)
-        
-        x = center_x - width // 2
-        y = center_y - height // 2
-        
-        # Bounds check and clamp
-        x = max(0, min(x, frame_width - 1))
-        y = max(0, min(y, frame_height - 1))
-        w = min(width, frame_width - x)
-        h = min(height, frame_height - y)
-        
-        if w > 0 and h > 0:
-            # Draw rectangle around blue goal
-            cv2.rectangle(display_frame, (x, y), (x + w, y + h), (255, 0, 0), 3)  # Blue box
-            
-            # Add label - ensure text stays in bounds
-            label = f"Blue: ({center_x}, {center_y})"
-            text_y = max(20, y - 10)
-            cv2.putText(display_frame, label, (x, text_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
-    
-    # Draw yellow goal detection
-    if vision_data.yellow_goal.detected:
-        center_x = int(vision_data.yellow_goal.center_x)
-        center_y = int(vision_data.yellow_goal.center_y)
-        width = int(vision_data.yellow_goal.width)
-        height = int(vision_data.yellow_goal.height)
-        
-        x = center_x - width // 2
-        y = center_y - height // 2
-        
-        # Bounds check and clamp
-        x = max(0, min(x, frame_width - 1))
-        y = max(0, min(y, frame_height - 1))
-        w = min(width, frame_width - x)
-        h = min(height, frame_height - y)
-        
-        if w > 0 and h > 0:
-            # Draw rectangle around yellow goal
-            cv2.rectangle(display_frame, (x, y), (x + w, y + h), (0, 255, 255), 3)  # Yellow box
+    # Draw goal detections
+    for goal, name, color in ((vision_data.blue_goal, "Blue", (255, 0, 0)),
+                              (vision_data.yellow_goal, "Yellow", (0, 255, 255))):
+        if not goal.detected:
+            continue
+        
+        box = _goal_overlay_box(goal, frame_width, frame_height)
+        if box is not None:
+            x, y, w, h = box
+            # Draw rectangle around goal
+            cv2.rectangle(display_frame, (x, y), (x + w, y + h), color, 3)
             
             # Add label - ensure text stays in bounds
-            label = f"Yellow: ({center_x}, {center_y})"
+            label = f"{name}: ({int(goal.center_x)}, {int(goal.center_y)})"
             text_y = max(20, y - 10)
             cv2.putText(display_frame, label, (x, text_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 2)
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
     
     # Add frame ID
     frame_label = f"Frame: {vision_data.frame_id}"
@@ -1257,16 +1308,13 @@ def add_debug_overlays(frame: np.ndarray, vision_data: VisionData) -> np.ndarray
         center_x = frame_width // 2
         center_y = frame_height // 2
         
-        # Get text size for centering
         text = "none detected"
         font = cv2.FONT_HERSHEY_SIMPLEX
         font_scale = 1.0
         thickness = 2
-        (text_width, text_height), baseline = cv2.getTextSize(text, font, font_scale, thickness)
         
-        # Center the text
-        text_x = center_x - text_width // 2
-        text_y = center_y + text_height // 2
+        # Center the text (placement only depends on frame size, so it's cached)
+        text_x, text_y = _centered_text_origin(center_x, center_y, text, font_scale, thickness)
         
         # Draw text with outline for better visibility
         cv2.putText(display_frame, text, (text_x, text_y),
@@ -1277,6 +1325,38 @@ def add_debug_overlays(frame: np.ndarray, vision_data: VisionData) -> np.ndarray
     return display_frame
 
 
+def encode_jpeg(frame: np.ndarray, quality: int = 85, subsampling: str = '444') -> Optional[bytes]:
+    """
+    Encode a BGR frame to JPEG bytes as fast as possible
+    
+    Uses simplejpeg's fast integer DCT when available. Huffman table
+    optimisation (optimize_coding) is intentionally left off: for a live
+    preview stream the few percent of extra bytes are irrelevant, the
+    encode time saved is what matters.
+    
+    Args:
+        frame: BGR (or BGRX) frame from camera (Picamera2 format)
+        quality: JPEG quality (1-100)
+        subsampling: Chroma subsampling ('444', '422' or '420').
+                    '420' roughly halves the bitstream for preview streams.
+        
+    Returns:
+        JPEG bytes, or None if encoding failed
+    """
+    if _HAS_SIMPLEJPEG:
+        colorspace = 'BGRX' if frame.ndim == 3 and frame.shape[2] == 4 else 'BGR'
+        return simplejpeg.encode_jpeg(np.ascontiguousarray(frame), quality=quality,
+                                      colorspace=colorspace, colorsubsampling=subsampling,
+                                      fastdct=True)
+    
+    params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+    sampling_flag = getattr(cv2, f'IMWRITE_JPEG_SAMPLING_FACTOR_{subsampling}', None)
+    if sampling_flag is not None:  # OpenCV >= 4.5.5
+        params += [cv2.IMWRITE_JPEG_SAMPLING_FACTOR, sampling_flag]
+    ok, buffer = cv2.imencode('.jpg', frame, params)
+    return buffer.tobytes() if ok else None
+
+
 def create_mask_preview(frame: np.ndarray, lower_hsv: np.ndarray, upper_hsv: np.ndarray, 
                        label: str = "") -> np.ndarray:
     """
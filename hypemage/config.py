@@ -29,14 +29,31 @@ from hypemage.logger import get_logger
 
 logger = get_logger(__name__)
 
+# orjson parses several times faster than the stdlib; fall back if missing
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 # Path to the central config file
 CONFIG_PATH = Path(__file__).parent / "config.json"
 
 
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson if available, else the stdlib"""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """
     Deep merge two dictionaries, with override taking precedence
     
+    Walks nested sections with an explicit work stack instead of recursing,
+    and only deep-copies override values that are actually containers.
+    
     Args:
         base: Base dictionary (defaults)
         override: Override dictionary (robot-specific)
@@ -46,16 +63,24 @@ def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]
     """
     result = deepcopy(base)
     
-    for key, value in override.items():
-        if key.startswith('_'):  # Skip comment fields
-            continue
+    # (destination, source) pairs still to merge - destinations are already
+    # owned by result, so they can be updated in place
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if key.startswith('_'):  # Skip comment fields
+                continue
             
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            # Recursively merge nested dicts
-            result[key] = deep_merge(result[key], value)
-        else:
-            # Override value
-            result[key] = deepcopy(value)
+            if type(value) is dict and type(dst.get(key)) is dict:
+                # Merge nested dicts
+                stack.append((dst[key], value))
+            elif type(value) is dict or type(value) is list:
+                # Override value (copy containers so result doesn't alias override)
+                dst[key] = deepcopy(value)
+            else:
+                # Override value (immutable scalar)
+                dst[key] = value
     
     return result
 
@@ -131,8 +156,8 @@ def load_config(robot_id: Optional[str] = None) -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {CONFIG_PATH}")
     
     try:
-        with open(CONFIG_PATH, 'r') as f:
-            all_config = json.load(f)
+        with open(CONFIG_PATH, 'rb') as f:
+            all_config = _json_loads(f.read())
         
         # Get defaults
         defaults = all_config.get('defaults', {})
@@ -150,7 +175,7 @@ def load_config(robot_id: Optional[str] = None) -> Dict[str, Any]:
         logger.info(f"Loaded configuration for robot: {robot_id} (with defaults merged)")
         return merged_config
     
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
         logger.error(f"Invalid JSON in config file: {e}")
         raise
     except Exception as e:
@@ -264,6 +289,10 @@ def get_default_config() -> Dict[str, Any]:
                 "max_area": 1000
             }
         },
+        "streaming": {
+            "quality": 75,
+            "subsampling": "420"
+        },
         "detection": {
             "proximity_threshold": 5000,
             "angle_tolerance": 15,
@@ -45,7 +45,7 @@ class MotorInitializationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class MotorCommand:
     """Motor command data structure"""
     type: str  # 'set_speeds', 'stop', 'shutdown'
@@ -53,13 +53,21 @@ class MotorCommand:
     timestamp: float = 0.0
 
 
+# Stop carries no payload and the worker never reads its timestamp, so one
+# shared instance is queued instead of building a new command per stop()
+# (state handlers call stop() every tick while e.g. the ball is out of sight)
+_STOP_CMD = MotorCommand(type='stop')
+
+_DEG_TO_RAD = math.pi / 180.0
+
+
 @dataclass
 class MotorStatus:
     """Motor status/telemetry data"""
     motor_count: int
     speeds: List[float]  # Current commanded speeds
     is_running: bool
-    last_command_time: float
+    last_command_time: float  # time.monotonic() of the last executed command
     watchdog_active: bool
 
 
@@ -94,6 +102,11 @@ class MotorController:
         # Default: all motors forward, but can be overridden in config
         self.motor_multipliers = self.config.get('motor_multipliers', [-1.0, -1.0, 1.0, 1.0])
         
+        # Per-motor factor from [-1.0, 1.0] speed straight to integer motor units
+        # (direction multiplier folded in), and the saturation limit in those units
+        self._max_speed_cmd = int(self.config['max_speed'])
+        self._speed_scales = [self.config['max_speed'] * m for m in self.motor_multipliers]
+        
         # Current state
         self.current_speeds = [0.0, 0.0, 0.0, 0.0]
         self.last_command_time = 0.0
@@ -287,7 +300,9 @@ class MotorController:
         - Implements watchdog safety (auto-stop if no commands)
         - Sends I2C commands to motors
         """
-        last_watchdog_check = time.time()
+        # Monotonic clock: an NTP step at boot (the Pi has no RTC) must not
+        # fire or suppress the watchdog
+        last_watchdog_check = time.monotonic()
         
         while not self.stop_event.is_set():
             # Try to get a command (non-blocking with timeout)
@@ -296,19 +311,29 @@ class MotorController:
             except queue.Empty:
                 cmd = None
             
+            # Coalesce a burst: speeds are absolute, so only the newest queued
+            # command matters - one I2C write per loop instead of one per command
+            # (a shutdown is never skipped over)
+            if cmd:
+                try:
+                    while cmd.type != 'shutdown':
+                        cmd = self.cmd_queue.get_nowait()
+                except queue.Empty:
+                    pass
+            
             # Process command
             if cmd:
                 if cmd.type == 'set_speeds':
                     self._execute_set_speeds(cmd.speeds)
-                    self.last_command_time = time.time()
+                    self.last_command_time = time.monotonic()
                 elif cmd.type == 'stop':
                     self._execute_stop()
-                    self.last_command_time = time.time()
+                    self.last_command_time = time.monotonic()
                 elif cmd.type == 'shutdown':
                     break
             
             # Watchdog check
-            current_time = time.time()
+            current_time = time.monotonic()
             if self.watchdog_enabled and (current_time - last_watchdog_check) > 0.05:
                 time_since_command = current_time - self.last_command_time
                 if time_since_command > self.watchdog_timeout:
@@ -335,19 +360,19 @@ class MotorController:
         
         self.current_speeds = list(speeds)
         
+        max_cmd = self._max_speed_cmd
         for i, (motor, speed) in enumerate(zip(self.motors, speeds)):
             if motor is None:
                 continue
             
             try:
-                # Apply motor multiplier (for direction correction)
-                speed = speed * self.motor_multipliers[i]
-                
-                # Clamp speed to [-1.0, 1.0]
-                speed = max(-1.0, min(1.0, speed))
-                
-                # Scale to motor units
-                speed_cmd = int(self.config['max_speed'] * speed)
+                # Scale to motor units (with direction multiplier), then
+                # saturate in integer units - same as clamping to [-1.0, 1.0] first
+                speed_cmd = int(speed * self._speed_scales[i])
+                if speed_cmd > max_cmd:
+                    speed_cmd = max_cmd
+                elif speed_cmd < -max_cmd:
+                    speed_cmd = -max_cmd
                 
                 motor.set_speed(speed_cmd)
                 
@@ -376,7 +401,7 @@ class MotorController:
             cmd = MotorCommand(
                 type='set_speeds',
                 speeds=list(speeds),
-                timestamp=time.time()
+                timestamp=time.monotonic()
             )
             try:
                 self.cmd_queue.put(cmd, block=False)
@@ -390,16 +415,25 @@ class MotorController:
         else:
             # Direct execution (blocking)
             self._execute_set_speeds(speeds)
-            self.last_command_time = time.time()
+            self.last_command_time = time.monotonic()
     
     def stop(self):
         """Stop all motors"""
         if self.threaded:
-            cmd = MotorCommand(type='stop', timestamp=time.time())
             try:
-                self.cmd_queue.put(cmd, block=False)
+                self.cmd_queue.put(_STOP_CMD, block=False)
             except queue.Full:
-                pass
+                # A stop must never be dropped: everything still queued is
+                # superseded by it anyway, so discard that and queue the stop
+                try:
+                    while True:
+                        self.cmd_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self.cmd_queue.put(_STOP_CMD, block=False)
+                except queue.Full:
+                    pass
         else:
             self._execute_stop()
     
@@ -424,17 +458,29 @@ class MotorController:
             controller.move_robot_relative(-90, 0.3)     # Move right at 30% speed
             controller.move_robot_relative(45, 0.5, 0.2) # Move diagonal with slight rotation
         """
-        angle = 180 + angle
-        if angle > 360:
-            angle -= 360
-        elif angle < 0:
-            angle += 360
-        # Convert angle to radians
-        angle_rad = math.radians(angle)
-        
-        # Calculate velocity components
-        vx = speed * math.sin(angle_rad)  # Left/right component
-        vy = speed * math.cos(angle_rad)  # Forward/back component
+        angle_rad = angle * _DEG_TO_RAD
+        self.move_robot_vector(speed * math.cos(angle_rad), speed * math.sin(angle_rad), rotation)
+    
+    def move_robot_vector(self, forward: float, left: float, rotation: float = 0.0):
+        """
+        Move robot with a velocity vector relative to the robot's orientation
+        
+        Same motion as move_robot_relative(angle, speed) with
+        forward = speed * cos(angle), left = speed * sin(angle), but without
+        the trig - callers with a fixed set of directions can precompute them.
+        
+        Args:
+            forward: Forward component (negative = backward)
+            left: Left component (negative = right)
+            rotation: Rotation component [-1.0 to 1.0] (positive = clockwise)
+        
+        Example:
+            controller.move_robot_vector(0.5, 0.0)       # Move forward at half speed
+            controller.move_robot_vector(0.0, -0.3)      # Move right at 30% speed
+        """
+        # The drive frame is rotated 180° from the robot frame
+        vx = -left     # Left/right component
+        vy = -forward  # Forward/back component
         
         # Calculate motor speeds using omniwheel kinematics
         # Each motor contributes to: forward/back, left/right, and rotation
@@ -9,14 +9,15 @@ Usage:
 """
 
 import asyncio
+from collections import deque
 from aiohttp import web
 import cv2
 import numpy as np
-import time
 import socket
 import sys
+import traceback
 
-from hypemage.camera import CameraProcess, add_debug_overlays, VisionData, BallDetectionResult, GoalDetectionResult
+from hypemage.camera import CameraProcess, add_debug_overlays, encode_jpeg, VisionData, BallDetectionResult, GoalDetectionResult
 from hypemage.config import get_robot_id
 
 # Use print for logging since it will be captured by interface.py
@@ -24,6 +25,31 @@ def log(msg):
     print(f"[camera_stream] {msg}", flush=True)
 
 
+# Target frame period for the stream (~30 FPS)
+FRAME_INTERVAL = 0.033
+
+# Longest time to hold back new frames waiting for slow clients
+MAX_SKIP_TIME = 1.0
+
+# Ball ROI tracking: search only around the last known ball position, with a
+# full-frame search every ROI_FULL_SEARCH_INTERVAL frames (and on the frame after
+# a miss) as recovery
+ROI_FULL_SEARCH_INTERVAL = 10
+ROI_RADIUS_SCALE = 3
+ROI_MIN_HALF_SIZE = 64
+
+# Multipart framing around each JPEG
+PART_TAIL = b'\r\n'
+
+
+def build_mjpeg_part(jpeg: bytes) -> bytes:
+    """Wrap a JPEG in its multipart/x-mixed-replace part, ready to write"""
+    header = (b'--frame\r\n'
+              b'Content-Type: image/jpeg\r\n'
+              b'Content-Length: ' + str(len(jpeg)).encode('ascii') + b'\r\n\r\n')
+    return b''.join((header, jpeg, PART_TAIL))
+
+
 def get_debug_port() -> int:
     """Determine debug port based on robot"""
     hostname = socket.gethostname().lower()
@@ -39,126 +65,222 @@ class CameraStreamer:
     def __init__(self):
         self.robot_id = get_robot_id()
         self.camera: CameraProcess | None = None
+        # Rolling window of frame timestamps (loop.time()) for an averaged FPS
+        self._frame_times: deque[float] = deque(maxlen=30)
         
+        # Shared output of the capture loop: every connected client streams
+        # the same encoded JPEG, so N viewers cost the same as one
+        self._latest_part: bytes | None = None  # framed multipart JPEG
+        self._frame_seq = 0
+        self._sent_seq = 0  # newest frame any client has finished writing
+        self._last_publish_t = 0.0
+        self._new_frame = asyncio.Condition()
+        self._num_clients = 0
+        self._has_clients = asyncio.Event()
+        
+        # Index page: only the Host header varies between requests
+        self._index_template = f"""
+        <html>
+        <head><title>Camera Stream - {self.robot_id}</title></head>
+        <body>
+            <h1>Camera Stream - {self.robot_id.upper()}</h1>
+            <img src="/stream" width="640" height="480">
+            <p>Stream URL: <code>http://{{host}}/stream</code></p>
+        </body>
+        </html>
+        """
+        
+        # (x1, y1, x2, y2) window around the last detected ball, or None
+        self._ball_roi: tuple[int, int, int, int] | None = None
+    
+    def _detect_ball_tracked(self, frame: np.ndarray, frame_count: int):
+        """Detect the ball inside the tracked ROI, falling back to a full-frame search"""
+        roi = self._ball_roi if frame_count % ROI_FULL_SEARCH_INTERVAL else None
+        # One detect_ball per frame: a miss inside the window clears the ROI
+        # below, so the full-frame search happens on the next frame
+        ball = self.camera.detect_ball(frame, roi=roi)
+        
+        if ball.detected and not ball.in_close_zone:
+            height, width = frame.shape[:2]
+            half = max(ROI_MIN_HALF_SIZE, ball.radius * ROI_RADIUS_SCALE)
+            self._ball_roi = (max(0, ball.center_x - half), max(0, ball.center_y - half),
+                              min(width, ball.center_x + half), min(height, ball.center_y + half))
+        else:
+            self._ball_roi = None
+        return ball
+    
+    async def capture_loop(self):
+        """
+        Produce frames for all clients: capture, validate, detect, overlay and
+        encode once per frame. Idles while nobody is watching.
+        """
+        # Preview encoding settings (lower quality + 4:2:0 halves the JPEG size)
+        stream_cfg = self.camera.config.get('streaming', {})
+        jpeg_quality = stream_cfg.get('quality', 75)
+        jpeg_subsampling = stream_cfg.get('subsampling', '420')
+        
+        loop = asyncio.get_running_loop()
+        frame_count = 0
+        
+        while True:
+            await self._has_clients.wait()
+            
+            # One monotonic clock read per iteration, reused for the
+            # rate limiter, FPS window and VisionData timestamp
+            start_time = loop.time()
+            
+            # Adaptive frame-skip: if no client has finished sending the last
+            # frame yet, anything we detect/encode now would just be dropped.
+            # Wait for the fastest client to catch up (bounded, in case it stalls).
+            if (self._sent_seq != self._frame_seq and
+                    start_time - self._last_publish_t < MAX_SKIP_TIME):
+                await asyncio.sleep(FRAME_INTERVAL)
+                continue
+            
+            # Capture frame from camera
+            try:
+                frame = self.camera.capture_frame()
+            except Exception as e:
+                log(f"ERROR capturing frame: {e}")
+                await asyncio.sleep(0.1)
+                continue
+            
+            if frame is None:
+                await asyncio.sleep(0.1)
+                continue
+            
+            # Validate frame (once here, clients only ever see valid JPEGs)
+            if not isinstance(frame, np.ndarray) or frame.size == 0:
+                log(f"WARNING: Invalid frame type or empty frame")
+                await asyncio.sleep(0.1)
+                continue
+            
+            vision_data = None
+            try:
+                # Run detections (detections expect BGR input from Picamera2)
+                ball = self._detect_ball_tracked(frame, frame_count)
+                blue_goal, yellow_goal = self.camera.detect_goals(frame)
+                
+                # Build vision data object
+                vision_data = VisionData(
+                    timestamp=start_time,
+                    frame_id=frame_count,
+                    raw_frame=frame,
+                    ball=ball,
+                    blue_goal=blue_goal,
+                    yellow_goal=yellow_goal
+                )
+                
+                # Add debug overlays safely
+                # add_debug_overlays expects BGR and returns BGR
+                debug_frame = add_debug_overlays(frame, vision_data)
+                
+            except Exception as e:
+                log(f"ERROR in detection/overlay: {e}")
+                traceback.print_exc()
+                # Fall back to plain frame (already BGR from Picamera2).
+                # Nothing downstream mutates it, so no copy is needed.
+                debug_frame = frame
+            
+            try:
+                # Encode to JPEG (expects BGR) - fast DCT, no optimize_coding
+                jpeg = encode_jpeg(debug_frame, quality=jpeg_quality, subsampling=jpeg_subsampling)
+                if jpeg is None:
+                    raise RuntimeError("JPEG encoding failed")
+            except Exception as e:
+                log(f"ERROR encoding frame: {e}")
+                await asyncio.sleep(0.1)
+                continue
+            
+            # Frame the part once here rather than once per client
+            part = build_mjpeg_part(jpeg)
+            
+            # Publish to all waiting clients
+            async with self._new_frame:
+                self._latest_part = part
+                self._frame_seq += 1
+                self._new_frame.notify_all()
+            self._last_publish_t = start_time
+            
+            frame_count += 1
+            self._frame_times.append(start_time)
+            if frame_count % 100 == 0:
+                window = self._frame_times[-1] - self._frame_times[0]
+                fps = int((len(self._frame_times) - 1) / max(window, 0.001))
+                detections = []
+                if vision_data is not None:
+                    if vision_data.ball.detected:
+                        detections.append(f"ball@({vision_data.ball.center_x},{vision_data.ball.center_y})")
+                    if vision_data.blue_goal.detected:
+                        detections.append(f"blue_goal")
+                    if vision_data.yellow_goal.detected:
+                        detections.append(f"yellow_goal")
+                det_str = ", ".join(detections) if detections else "no detections"
+                log(f"Streamed {frame_count} frames (~{fps} FPS, {self._num_clients} clients) - {det_str}")
+            
+            # Limit to ~30 FPS
+            elapsed = loop.time() - start_time
+            if elapsed < FRAME_INTERVAL:
+                await asyncio.sleep(FRAME_INTERVAL - elapsed)
+            else:
+                await asyncio.sleep(0)  # let client writers run
+    
     async def mjpeg_handler(self, request):
-        """Handle MJPEG stream requests"""
+        """Handle MJPEG stream requests - streams frames produced by capture_loop"""
         log(f"Client connected: {request.remote}")
         
         response = web.StreamResponse()
         response.content_type = 'multipart/x-mixed-replace; boundary=frame'
         await response.prepare(request)
         
+        # Don't let Nagle hold back the tail of each part (aiohttp normally
+        # enables this already; make sure for the stream socket)
+        sock = request.transport.get_extra_info('socket') if request.transport else None
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+        
+        self._num_clients += 1
+        self._has_clients.set()
+        # Start from the newest frame already published (if any)
+        last_seq = self._frame_seq - 1 if self._latest_part is not None else self._frame_seq
+        
         try:
-            frame_count = 0
             while True:
-                start_time = time.time()
-                
-                # Capture frame from camera
-                try:
-                    frame = self.camera.capture_frame()
-                except Exception as e:
-                    log(f"ERROR capturing frame: {e}")
-                    await asyncio.sleep(0.1)
-                    continue
-                
-                if frame is None:
-                    await asyncio.sleep(0.1)
-                    continue
-                
-                # Validate frame
-                if not isinstance(frame, np.ndarray) or frame.size == 0:
-                    log(f"WARNING: Invalid frame type or empty frame")
-                    await asyncio.sleep(0.1)
-                    continue
-                
-                try:
-                    # Run detections (detections expect BGR input from Picamera2)
-                    ball = self.camera.detect_ball(frame)
-                    blue_goal, yellow_goal = self.camera.detect_goals(frame)
-                    
-                    # Build vision data object
-                    vision_data = VisionData(
-                        timestamp=time.time(),
-                        frame_id=frame_count,
-                        raw_frame=frame,
-                        ball=ball,
-                        blue_goal=blue_goal,
-                        yellow_goal=yellow_goal
-                    )
-                    
-                    # Add debug overlays safely
-                    # add_debug_overlays expects BGR and returns BGR
-                    debug_frame = add_debug_overlays(frame, vision_data)
-                    
-                except Exception as e:
-                    log(f"ERROR in detection/overlay: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Fall back to plain frame
-                    # Frame is already in BGR format from Picamera2
-                    debug_frame = frame.copy()
+                # Wait for a frame this client hasn't sent yet
+                async with self._new_frame:
+                    await self._new_frame.wait_for(lambda: self._frame_seq != last_seq)
+                    last_seq = self._frame_seq
+                    part = self._latest_part
                 
-                try:
-                    # Encode to JPEG (expects BGR)
-                    _, buffer = cv2.imencode('.jpg', debug_frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                # Send as multipart - one pre-framed buffer, one write
+                # (write() drains when the transport buffer is over its limit)
+                await response.write(part)
+                self._sent_seq = max(self._sent_seq, last_seq)
                     
-                    # Send as multipart
-                    await response.write(
-                        b'--frame\r\n'
-                        b'Content-Type: image/jpeg\r\n\r\n' + 
-                        buffer.tobytes() + 
-                        b'\r\n'
-                    )
-                except Exception as e:
-                    log(f"ERROR encoding/sending frame: {e}")
-                    await asyncio.sleep(0.1)
-                    continue
-                
-                frame_count += 1
-                if frame_count % 100 == 0:
-                    fps = int(1.0 / max(time.time() - start_time, 0.001))
-                    try:
-                        detections = []
-                        if vision_data.ball.detected:
-                            detections.append(f"ball@({vision_data.ball.center_x},{vision_data.ball.center_y})")
-                        if vision_data.blue_goal.detected:
-                            detections.append(f"blue_goal")
-                        if vision_data.yellow_goal.detected:
-                            detections.append(f"yellow_goal")
-                        det_str = ", ".join(detections) if detections else "no detections"
-                        log(f"Streamed {frame_count} frames (~{fps} FPS) - {det_str}")
-                    except:
-                        log(f"Streamed {frame_count} frames (~{fps} FPS)")
-                
-                # Limit to ~30 FPS
-                elapsed = time.time() - start_time
-                if elapsed < 0.033:
-                    await asyncio.sleep(0.033 - elapsed)
-                    
-        except asyncio.CancelledError:
+        except (asyncio.CancelledError, ConnectionResetError):
             log(f"Client disconnected: {request.remote}")
         except Exception as e:
             log(f"ERROR in stream: {e}")
-            import traceback
             traceback.print_exc()
         finally:
-            await response.write_eof()
+            self._num_clients -= 1
+            if self._num_clients == 0:
+                self._has_clients.clear()
+            try:
+                await response.write_eof()
+            except Exception:
+                pass
         
         return response
     
     async def index_handler(self, request):
         """Simple test page"""
-        html = f"""
-        <html>
-        <head><title>Camera Stream - {self.robot_id}</title></head>
-        <body>
-            <h1>Camera Stream - {self.robot_id.upper()}</h1>
-            <img src="/stream" width="640" height="480">
-            <p>Stream URL: <code>http://{request.host}/stream</code></p>
-        </body>
-        </html>
-        """
-        return web.Response(text=html, content_type='text/html')
+        # Host comes from the client, so render per request rather than caching by it
+        body = self._index_template.format(host=request.host).encode('utf-8')
+        return web.Response(body=body, content_type='text/html', charset='utf-8')
 
 
 async def main():
@@ -177,7 +299,6 @@ async def main():
         log("Camera initialized")
     except Exception as e:
         log(f"ERROR: Failed to initialize camera: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
     
@@ -192,6 +313,9 @@ async def main():
     site = web.TCPSite(runner, '0.0.0.0', port)
     await site.start()
     
+    # Single capture/encode loop shared by all stream clients
+    capture_task = asyncio.create_task(streamer.capture_loop())
+    
     log(f"HTTP server started on port {port}")
     log(f"Stream URL: http://0.0.0.0:{port}/stream")
     
@@ -201,6 +325,7 @@ async def main():
     except KeyboardInterrupt:
         log("Shutting down...")
     finally:
+        capture_task.cancel()
         await runner.cleanup()
         if streamer.camera:
             del streamer.camera
@@ -214,6 +339,5 @@ if __name__ == "__main__":
         log("Camera stream stopped by user")
     except Exception as e:
         log(f"ERROR: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
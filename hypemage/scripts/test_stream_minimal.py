@@ -9,12 +9,13 @@ import numpy as np
 import time
 import socket
 import sys
+import traceback
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from camera import CameraProcess
+from camera import CameraProcess, encode_jpeg
 from config import get_robot_id
 
 def log(msg):
@@ -36,6 +37,36 @@ class SimpleStreamer:
         self.camera = None
         self.frame_count = 0
         
+        # Test page with the static parts filled in once; only the Host
+        # header and the time vary per request
+        self._html_template = f"""
+        <html>
+        <head>
+            <title>Minimal Camera Test - {self.robot_id}</title>
+            <style>
+                body {{{{ font-family: monospace; background: #222; color: #0f0; padding: 20px; }}}}
+                img {{{{ border: 2px solid #0f0; }}}}
+                .info {{{{ background: #333; padding: 10px; margin: 10px 0; }}}}
+            </style>
+        </head>
+        <body>
+            <h1>Minimal Camera Stream Test</h1>
+            <div class="info">
+                <div>Robot: {self.robot_id}</div>
+                <div>Port: {{host}}</div>
+                <div>Time: {{time}}</div>
+            </div>
+            <img src="/stream" width="640" height="480">
+            <div class="info">
+                Stream URL: <code>http://{{host}}/stream</code>
+            </div>
+            <div class="info">
+                If you see a green frame counter, the stream is working!
+            </div>
+        </body>
+        </html>
+        """
+        
     async def stream_handler(self, request):
         """Minimal MJPEG stream handler with debug output"""
         log(f"Client connected from {request.remote}")
@@ -44,6 +75,11 @@ class SimpleStreamer:
         response.content_type = 'multipart/x-mixed-replace; boundary=frame'
         await response.prepare(request)
         
+        stream_cfg = self.camera.config.get('streaming', {})
+        jpeg_quality = stream_cfg.get('quality', 75)
+        jpeg_subsampling = stream_cfg.get('subsampling', '420')
+        log(f"JPEG encoding: quality={jpeg_quality}, subsampling={jpeg_subsampling}")
+        
         try:
             while True:
                 # Capture frame
@@ -56,19 +92,17 @@ class SimpleStreamer:
                 
                 log(f"Frame {self.frame_count}: shape={frame.shape}, dtype={frame.dtype}")
                 
-                # Frame is already in BGR format from Picamera2
-                bgr_frame = frame
-                
-                # Add simple text overlay to confirm it's working
-                cv2.putText(bgr_frame, f"Frame: {self.frame_count}", (10, 30),
+                # Frame is already in BGR format from Picamera2 - draw and
+                # encode it directly, no colour conversion or copy needed
+                cv2.putText(frame, f"Frame: {self.frame_count}", (10, 30),
                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                cv2.putText(bgr_frame, f"Robot: {self.robot_id}", (10, 70),
+                cv2.putText(frame, f"Robot: {self.robot_id}", (10, 70),
                            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
                 
-                # Encode to JPEG
-                success, buffer = cv2.imencode('.jpg', bgr_frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                # Encode to JPEG (fast DCT, optimize_coding deliberately off)
+                buffer = encode_jpeg(frame, quality=jpeg_quality, subsampling=jpeg_subsampling)
                 
-                if not success:
+                if buffer is None:
                     log("ERROR: Failed to encode frame")
                     await asyncio.sleep(0.1)
                     continue
@@ -80,7 +114,7 @@ class SimpleStreamer:
                     await response.write(
                         b'--frame\r\n'
                         b'Content-Type: image/jpeg\r\n\r\n' +
-                        buffer.tobytes() +
+                        buffer +
                         b'\r\n'
                     )
                     log(f"Sent frame {self.frame_count}")
@@ -93,7 +127,6 @@ class SimpleStreamer:
                 
         except Exception as e:
             log(f"Stream ERROR: {e}")
-            import traceback
             traceback.print_exc()
         finally:
             log("Client disconnected")
@@ -102,33 +135,7 @@ class SimpleStreamer:
     
     async def test_handler(self, request):
         """Simple test page"""
-        html = f"""
-        <html>
-        <head>
-            <title>Minimal Camera Test - {self.robot_id}</title>
-            <style>
-                body {{ font-family: monospace; background: #222; color: #0f0; padding: 20px; }}
-                img {{ border: 2px solid #0f0; }}
-                .info {{ background: #333; padding: 10px; margin: 10px 0; }}
-            </style>
-        </head>
-        <body>
-            <h1>Minimal Camera Stream Test</h1>
-            <div class="info">
-                <div>Robot: {self.robot_id}</div>
-                <div>Port: {request.host}</div>
-                <div>Time: {time.strftime('%H:%M:%S')}</div>
-            </div>
-            <img src="/stream" width="640" height="480">
-            <div class="info">
-                Stream URL: <code>http://{request.host}/stream</code>
-            </div>
-            <div class="info">
-                If you see a green frame counter, the stream is working!
-            </div>
-        </body>
-        </html>
-        """
+        html = self._html_template.format(host=request.host, time=time.strftime('%H:%M:%S'))
         return web.Response(text=html, content_type='text/html')
 
 async def main():
@@ -150,7 +157,6 @@ async def main():
         log("✓ Camera initialized")
     except Exception as e:
         log(f"✗ FAILED to initialize camera: {e}")
-        import traceback
         traceback.print_exc()
         return
     
@@ -164,7 +170,6 @@ async def main():
         log(f"✓ Test frame: shape={test_frame.shape}, dtype={test_frame.dtype}")
     except Exception as e:
         log(f"✗ Frame capture failed: {e}")
-        import traceback
         traceback.print_exc()
         return
     
@@ -203,5 +208,4 @@ if __name__ == "__main__":
         asyncio.run(main())
     except Exception as e:
         log(f"FATAL ERROR: {e}")
-        import traceback
         traceback.print_exc()
@@ -9,17 +9,22 @@ CRITICAL ERROR HANDLING:
 - Localization fails: Robot continues with warning (can still move with camera only)
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Set, Callable, Optional, Any, List
+from dataclasses import dataclass, field, replace
+from typing import Dict, Set, Callable, Optional, Any, List, Tuple
 from threading import Thread, Event as ThreadEvent
-from multiprocessing import Process, Queue, Event, get_context
-from enum import Enum, auto
+from multiprocessing import Process, Queue, Event, get_context, get_all_start_methods
+from enum import IntEnum, auto
+import os
+import queue
+import selectors
 import time
 import sys
 import math
 import atexit
+import logging
 import signal
 
+from hypemage.shared_flag import SharedFlag
 from hypemage.logger import get_logger
 from hypemage.motor_control import MotorController, MotorInitializationError
 
@@ -29,6 +34,7 @@ logger = get_logger(__name__)
 # Try to import camera module, but don't fail if cv2 is not available
 try:
     from hypemage.camera import CameraProcess, CameraInitializationError
+    from hypemage.vision_ring import VisionRing
     CAMERA_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"Camera module not available: {e}")
@@ -36,6 +42,7 @@ except ImportError as e:
     CAMERA_AVAILABLE = False
     CameraProcess = None
     CameraInitializationError = Exception
+    VisionRing = None
 
 # Try to import dribbler and kicker, but continue if they fail
 try:
@@ -55,6 +62,23 @@ except ImportError as e:
     MOTOR_AVAILABLE = False
     Motor = None
 
+# lgpio gives kernel-delivered edge alerts for the buttons; fall back to
+# polling through digitalio if it isn't installed
+try:
+    import lgpio
+    _HAS_LGPIO = True
+except ImportError:
+    _HAS_LGPIO = False
+
+# Blinka pin definitions + digitalio for the polling fallback (Pi only)
+try:
+    import board
+    import digitalio
+    _HAS_BOARD = True
+except ImportError:
+    board = digitalio = None
+    _HAS_BOARD = False
+
 try:
     from hypemage.kicker_control import KickerController
     KICKER_AVAILABLE = True
@@ -64,7 +88,113 @@ except ImportError as e:
     KickerController = None
 
 
-@dataclass
+# CPU cores per process on the Pi 5 (override with config['affinity']).
+# Keeping each process on its own core avoids cache-cold migrations and
+# scheduler jitter in the control loop.
+DEFAULT_AFFINITY = {'scylla': 0, 'localization': 2, 'camera': 3}
+
+
+def _pin_to_cpu(cpu: Optional[int]):
+    """Pin the calling process to one CPU core (no-op if unsupported or cpu is None)"""
+    if cpu is None or not hasattr(os, 'sched_setaffinity'):
+        return
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError as e:
+        logger.warning(f"Could not pin process to CPU {cpu}: {e}")
+
+
+def _tune_fsm_threads(cpu: Optional[int], niceness: int):
+    """
+    Pin every thread of the calling process to one core and, when running as
+    root, set their nice value
+    
+    Affinity and nice are per-thread on Linux, so threads that are already
+    running (motor worker, button poller) have to be changed one by one. Call
+    this only once the children are up - anything forked afterwards (the
+    forkserver included) would inherit the pin and the priority. Threads
+    started later inherit the settings of the thread that creates them.
+    """
+    try:
+        tids = [int(tid) for tid in os.listdir('/proc/self/task')]
+    except OSError:
+        tids = [0]  # no procfs: just the calling thread
+    # Lowering nice needs CAP_SYS_NICE - don't try (and warn) on every dev run
+    can_renice = hasattr(os, 'geteuid') and os.geteuid() == 0
+    
+    for tid in tids:
+        try:
+            if cpu is not None and hasattr(os, 'sched_setaffinity'):
+                os.sched_setaffinity(tid, {cpu})
+            if can_renice:
+                os.setpriority(os.PRIO_PROCESS, tid, niceness)
+        except ProcessLookupError:
+            pass  # thread exited since we listed it
+        except OSError as e:
+            logger.warning(f"Could not tune FSM thread {tid}: {e}")
+
+
+def _run_pinned(cpu: Optional[int], target: Callable, *args):
+    """
+    Process target wrapper: pin to a core first, then run target(*args)
+    
+    Once target returns (stop flag seen) the child exits with os._exit rather
+    than the normal interpreter teardown - there is nothing left to finalize
+    (results live in shared memory, the parent owns and unlinks the blocks), and
+    skipping atexit/GC keeps it well inside the shutdown join deadline instead
+    of hitting the terminate fallback.
+    """
+    code = 0
+    try:
+        _pin_to_cpu(cpu)
+        target(*args)
+    except SystemExit as e:
+        # Same mapping as the interpreter: None -> 0, int as-is, anything else -> 1
+        if e.code is None or isinstance(e.code, int):
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except KeyboardInterrupt:
+        # Ctrl+C reaches the whole process group - the parent handles shutdown
+        code = 130
+    except Exception:
+        logger.exception("Unhandled exception in %s", getattr(target, '__name__', target))
+        code = 1
+    finally:
+        # Don't lose buffered output/log lines on the way out
+        logging.shutdown()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def _direction_label(angle: float) -> str:
+    """General direction name for a robot-relative angle (0° = forward, + = left)"""
+    if -22.5 <= angle <= 22.5:
+        return "FORWARD"
+    elif 22.5 < angle <= 67.5:
+        return "FORWARD-LEFT"
+    elif 67.5 < angle <= 112.5:
+        return "LEFT"
+    elif 112.5 < angle <= 157.5:
+        return "BACK-LEFT"
+    elif 157.5 < angle or angle <= -157.5:
+        return "BACKWARD"
+    elif -157.5 < angle <= -112.5:
+        return "BACK-RIGHT"
+    elif -112.5 < angle <= -67.5:
+        return "RIGHT"
+    elif -67.5 < angle <= -22.5:
+        return "FORWARD-RIGHT"
+    return "UNKNOWN"
+
+
+# Status glyph indexed by a bool/bit (False/0 -> ✗, True/1 -> ✓)
+_STATUS_MARK = ('✗', '✓')
+
+
+@dataclass(slots=True)
 class ComponentStatus:
     """Tracks initialization status of critical and non-critical components"""
     # Critical components (robot cannot operate without these)
@@ -75,7 +205,7 @@ class ComponentStatus:
     localization: bool = False
     goal_localizer: bool = False
     imu: bool = False
-    tof_sensors: List[bool] = field(default_factory=lambda: [False]*4)
+    tof_sensors: int = 0  # bitfield, bit i set = ToF sensor i OK (4 sensors)
     dribbler: bool = False
     kicker: bool = False
     
@@ -83,16 +213,36 @@ class ComponentStatus:
         """Check if all critical components are working"""
         return self.motors  # Camera checked per-state
     
+    def tof(self, i: int) -> bool:
+        """Check if ToF sensor i is working"""
+        return bool(self.tof_sensors >> i & 1)
+    
+    def set_tof(self, i: int, ok: bool):
+        """Mark ToF sensor i as working or not"""
+        if ok:
+            self.tof_sensors |= 1 << i
+        else:
+            self.tof_sensors &= ~(1 << i)
+    
     def summary(self) -> str:
         """Get status summary string"""
-        critical = f"Motors: {'✓' if self.motors else '✗'}, Camera: {'✓' if self.camera else '✗'}"
-        non_critical = f"Localization: {'✓' if self.localization else '✗'}, Dribbler: {'✓' if self.dribbler else '✗'}, Kicker: {'✓' if self.kicker else '✗'}"
-        return f"[CRITICAL: {critical}] [NON-CRITICAL: {non_critical}]"
+        ok = _STATUS_MARK
+        critical = f"Motors: {ok[self.motors]}, Camera: {ok[self.camera]}"
+        tof = ''.join(ok[self.tof_sensors >> i & 1] for i in range(4))
+        non_critical = f"Localization: {ok[self.localization]}, ToF: {tof}, Dribbler: {ok[self.dribbler]}, Kicker: {ok[self.kicker]}"
         return f"[CRITICAL: {critical}] [NON-CRITICAL: {non_critical}]"
+    
+    # So the status can be passed as a lazy logging argument
+    __str__ = summary
 
 
-class State(Enum):
-    """All possible robot states"""
+class State(IntEnum):
+    """
+    All possible robot states
+    
+    IntEnum so the per-tick table lookups and comparisons hash/compare as plain
+    ints. Log with state.name - str(state) is the number.
+    """
     OFF_FIELD = auto()
     PAUSED = auto()
     CHASE_BALL = auto()
@@ -104,18 +254,58 @@ class State(Enum):
     MOVE_STRAIGHT = auto()   # Move forward in straight line
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StateConfig:
-    """Configuration for what resources a state needs"""
+    """Configuration for what resources a state needs (immutable)"""
     needs_camera: bool = False
     needs_localization: bool = False
     needs_motors: bool = False
     update_rate_hz: float = 20.0  # how fast to run this state's logic
+    holds_motor_command: bool = False  # only re-sends one command - tick paced by the motor watchdog
+    target_dt_ns: int = field(init=False)  # nanoseconds per tick, derived from update_rate_hz
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'target_dt_ns', int(1e9 / self.update_rate_hz))
 
 
 class Scylla:
     """Main robot FSM controller"""
     
+    # Fixed attribute layout: faster attribute access in the tick, and a typo'd
+    # self.<name> = ... fails loudly instead of silently creating a new attribute.
+    # Add new instance attributes here.
+    __slots__ = (
+        'config', 'current_state', 'previous_state', 'status', '_handlers', '_current',
+        '_is_paused', '_pause_state_backup',
+        'ctx', '_affinity', 'processes', 'queues', 'events', '_selector',
+        'button_q', 'stop_evt', 'camera_active_evt', 'camera_detect_ball_evt',
+        'camera_ring',
+        'latest_camera_data', '_camera_data_fresh', 'latest_localization_data', 'latest_button_input',
+        '_frames_without_ball', '_last_ball_was_close',
+        '_square_step', '_square_start_ns', '_square_step_duration_ns', '_square_speed', '_square_move',
+        'last_update_ns',
+        'motor_controller', 'dribbler_controller', 'simple_dribbler_motor', 'kicker_controller',
+        'button_stop_evt', 'button_thread', '_button_pending', '_button_ready',
+    )
+    
+    # Per-state variables saved across pause/resume. Taken from __slots__, so the
+    # set is fixed at class creation instead of scanned with dir() on every pause.
+    _STATE_VARS = tuple(name for name in __slots__
+                        if name.startswith(('_search_', '_square_', '_lineup_', '_defend_', '_attack_')))
+    
+    # MOVE_IN_SQUARE direction per step:
+    # 0 = forward (0°), 1 = left (270°), 2 = back (180°), 3 = right (90°)
+    SQUARE_DIRECTIONS = (0, 270, 180, 90)
+    _SQUARE_MASK = len(SQUARE_DIRECTIONS) - 1  # step index wraps with & (4 steps, power of two)
+    # ...and the same directions as unit (forward, left) vectors, so the tick
+    # can drive with move_robot_vector() instead of redoing the trig
+    SQUARE_VECTORS = tuple((math.cos(math.radians(a)), math.sin(math.radians(a)))
+                           for a in SQUARE_DIRECTIONS)
+    
+    # CHASE_BALL tunables
+    CHASE_SPEED = 0.07            # drive speed towards the ball
+    CHASE_DRIBBLER_SPEED = 1.8    # dribbler speed while the ball is (or was just) close
+    
     # Define state configurations (what each state needs)
     STATE_CONFIGS: Dict[State, StateConfig] = {
         State.OFF_FIELD: StateConfig(
@@ -158,7 +348,7 @@ class Scylla:
             needs_camera=False,
             needs_localization=False,
             needs_motors=True,  # need motors to send stop command
-            update_rate_hz=10.0
+            update_rate_hz=5.0  # stop is sent on entry; the tick has nothing to do
         ),
         State.MOVE_IN_SQUARE: StateConfig(
             needs_camera=False,
@@ -170,7 +360,12 @@ class Scylla:
             needs_camera=False,
             needs_localization=False,
             needs_motors=True,
-            update_rate_hz=20.0
+            # Constant command - the tick only has to refresh it inside the
+            # motor watchdog timeout, so _pace_held_commands() sets the rate to
+            # twice per timeout (5 Hz is the fallback with the watchdog off).
+            # Button presses still wake the loop immediately through the selector.
+            update_rate_hz=5.0,
+            holds_motor_command=True
         ),
     }
     
@@ -211,16 +406,31 @@ class Scylla:
         # Component status tracking
         self.status = ComponentStatus()
         
-        # Multiprocessing context
-        self.ctx = get_context('spawn')
+        # Per-state (handler, on_enter, on_exit, config, polls), resolved once
+        self._handlers = self._build_handler_table()
+        self._current = self._handlers[self.current_state]  # re-cached on each transition
+        
+        # Multiprocessing context: forkserver imports the heavy modules once in
+        # the server and forks children from it, so starting the camera doesn't
+        # re-import cv2/numpy (seconds on the Pi). Falls back to spawn elsewhere.
+        # Only modules are preloaded - no camera/I2C handles exist in the server.
+        if 'forkserver' in get_all_start_methods():
+            self.ctx = get_context('forkserver')
+            self.ctx.set_forkserver_preload(['numpy', 'cv2', 'hypemage.camera', 'hypemage.vision_ring'])
+        else:
+            self.ctx = get_context('spawn')
+        self._affinity = self.config.get('affinity', DEFAULT_AFFINITY)
         
         # Process management
         self.processes: Dict[str, Any] = {}  # Type hint relaxed for SpawnProcess
+        # Plain ctx queues / shared memory only - never Manager() proxies here:
+        # every put/get on a proxy is an RPC through the manager process
         self.queues: Dict[str, Any] = {}
         self.events: Dict[str, Any] = {}
         
         # Shared state/data
         self.latest_camera_data = None
+        self._camera_data_fresh = False  # latest_camera_data arrived this tick
         self.latest_localization_data = None
         self.latest_button_input = None
         
@@ -228,8 +438,21 @@ class Scylla:
         self._frames_without_ball = 0  # Counter for frames without ball detection
         self._last_ball_was_close = False  # Track if last seen ball was close
         
-        # Timing
-        self.last_update_time = 0.0
+        # Move-in-square tracking (seeded by on_enter_move_in_square)
+        self._square_step = 0
+        self._square_start_ns = 0
+        self._square_step_duration_ns = 0
+        self._square_speed = 0.0
+        self._square_move = None
+        
+        # Timing (time.monotonic_ns() - integer, immune to wall-clock jumps)
+        self.last_update_ns = 0
+        
+        # Button thread (started by start() if buttons are configured)
+        self.button_stop_evt = None
+        self.button_thread = None
+        self._button_pending = None  # lgpio callback -> button thread hand-off
+        self._button_ready = None  # set once the button thread's GPIO setup is done
         
         # Motor controller (critical - must init first)
         self.motor_controller = None
@@ -242,6 +465,7 @@ class Scylla:
         # Initialize resources
         self._init_queues()
         self._init_events()
+        self._init_selector()
         self._init_critical_components()
         self._init_non_critical_components()
         
@@ -275,9 +499,10 @@ class Scylla:
         Emergency motor stop - called by atexit and signal handlers
         
         This is a failsafe to ensure motors always stop, even on crashes.
-        It's safe to call multiple times.
+        It's safe to call multiple times. The controller slots are always
+        assigned (None until initialized) before this is registered.
         """
-        if hasattr(self, 'motor_controller') and self.motor_controller:
+        if self.motor_controller:
             try:
                 self.motor_controller.stop()
                 logger.debug("Emergency motor stop executed")
@@ -286,7 +511,7 @@ class Scylla:
                 logger.error(f"Emergency motor stop failed: {e}")
         
         # Also stop dribbler
-        if hasattr(self, 'dribbler_controller') and self.dribbler_controller:
+        if self.dribbler_controller:
             try:
                 self.dribbler_controller.stop()
                 logger.debug("Emergency dribbler stop executed")
@@ -294,7 +519,7 @@ class Scylla:
                 logger.error(f"Emergency dribbler stop failed: {e}")
         
         # Stop simple dribbler motor
-        if hasattr(self, 'simple_dribbler_motor') and self.simple_dribbler_motor:
+        if self.simple_dribbler_motor:
             try:
                 self.simple_dribbler_motor.set_speed(0)
                 logger.debug("Emergency simple dribbler motor stop executed")
@@ -325,8 +550,28 @@ class Scylla:
             logger.critical("Exiting...")
             sys.exit(1)
         
+        self._pace_held_commands()
+        
         # Log component status
-        logger.info(f"Component status: {self.status.summary()}")
+        logger.info("Component status: %s", self.status)
+    
+    def _pace_held_commands(self):
+        """
+        Tick states that hold a constant motor command twice per watchdog timeout
+        
+        Those states only refresh their command once per tick, so the period is
+        taken from the motor controller's watchdog_timeout (timeout / 2) rather
+        than a fixed rate that a shorter timeout would silently outrun.
+        """
+        mc = self.motor_controller
+        if not mc.watchdog_enabled:
+            return
+        rate_hz = 2.0 / mc.watchdog_timeout
+        for state, entry in self._handlers.items():
+            cfg = entry[3]
+            if cfg.holds_motor_command:
+                self._handlers[state] = entry[:3] + (replace(cfg, update_rate_hz=rate_hz),) + entry[4:]
+        self._current = self._handlers[self.current_state]
     
     def _init_non_critical_components(self):
         """
@@ -383,6 +628,11 @@ class Scylla:
             logger.warning("Motor module not available - skipping simple dribbler initialization")
             self.simple_dribbler_motor = None
         
+        # Start the camera process (NON-CRITICAL here - camera-dependent
+        # states check for vision themselves); it idles until a state needs it
+        self._launch_camera_process()
+        self._launch_localization_process()
+        
         # Initialize kicker (NON-CRITICAL)
         if KICKER_AVAILABLE:
             try:
@@ -401,34 +651,88 @@ class Scylla:
             self.kicker_controller = None
         
         # Log updated component status
-        logger.info(f"Component status: {self.status.summary()}")
+        logger.info("Component status: %s", self.status)
     
     def _init_queues(self):
         """Create all necessary queues"""
         # Camera
         self.queues['camera_cmd'] = self.ctx.Queue()
-        self.queues['camera_out'] = self.ctx.Queue()
+        
+        # Camera results go through a shared-memory ring instead of a Queue:
+        # no pickling per frame, and we only ever want the newest one anyway.
+        # config['share_camera_frames'] also gives each slot a frame buffer so
+        # raw frames (capture_frame with compress=False) can come back too.
+        self.camera_ring = None
+        if CAMERA_AVAILABLE:
+            frame_shape = None
+            if self.config.get('share_camera_frames'):
+                from hypemage.config import load_config
+                cam_cfg = load_config()['camera']
+                frame_shape = (cam_cfg['height'], cam_cfg['width'], 3)
+            self.camera_ring = VisionRing(frame_shape=frame_shape)
         
         # Localization
         self.queues['loc_cmd'] = self.ctx.Queue()
         self.queues['loc_out'] = self.ctx.Queue()
         
-        # # Motor control (if you decide to make it a process)
-        # self.queues['motor_cmd'] = self.ctx.Queue()
+        # Motor control stays in this process: MotorController runs its own
+        # worker thread with a queue.Queue (I2C handles can't cross processes)
         
-        # Button input
-        self.queues['button_out'] = self.ctx.Queue()
+        # Button input (producer is a thread in this process: a SimpleQueue
+        # pickles synchronously into its pipe, no feeder thread)
+        self.queues['button_out'] = self.ctx.SimpleQueue()
+        self.button_q = self.queues['button_out']
+    
+    def _init_selector(self):
+        """
+        Register the input queues' pipe FDs so _update can sleep until data
+        arrives or the next tick is due, instead of polling with short sleeps
+        
+        Camera data lives in shared memory (no FD) and is read once per tick.
+        """
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.queues['loc_out']._reader, selectors.EVENT_READ,
+                                self._poll_localization_data)
+        self._selector.register(self.queues['button_out']._reader, selectors.EVENT_READ,
+                                self._poll_button_input)
     
     def _init_events(self):
-        """Create all necessary events"""
-        self.events['stop'] = self.ctx.Event()
+        """
+        Create all necessary events
+        
+        Broadcast signals (stop, camera/localization on-off) are shared flags
+        passed to every process that needs them: one set() is seen by all
+        readers on their next loop, with no per-recipient queue and no message
+        to deliver. Add a new fan-out signal here rather than as a queue message.
+        """
+        # Polled every loop by Scylla and the children, never waited on: a
+        # lock-free shared byte instead of an Event
+        self.events['stop'] = SharedFlag(self.ctx)
         self.events['camera_active'] = self.ctx.Event()
         self.events['loc_active'] = self.ctx.Event()
+        
+        # Single-bit commands: cheaper as shared flags than as queued dicts
+        self.events['camera_detect_ball'] = self.ctx.Event()  # camera detects ball only while set
+        
+        # Direct references for the ones touched every loop / on every transition
+        self.stop_evt = self.events['stop']
+        self.camera_active_evt = self.events['camera_active']
+        self.camera_detect_ball_evt = self.events['camera_detect_ball']
     
     def start(self):
         """Start the FSM main loop"""
         self._start_always_on_processes()
         
+        # Give the control loop its own core and a bit more priority. Done
+        # only now that the children and the forkserver are running, so they
+        # keep their own affinity/priority instead of inheriting the FSM's;
+        # the motor worker and button poller share the FSM's core. Wait for
+        # the button GPIO setup first so lgpio's callback thread exists and
+        # gets tuned too.
+        if self._button_ready is not None:
+            self._button_ready.wait(timeout=2.0)
+        _tune_fsm_threads(self._affinity.get('scylla'), niceness=-5)
+        
         # Start simple dribbler motor at speed 3.0 (runs throughout the game)
         if self.simple_dribbler_motor:
             try:
@@ -439,7 +743,8 @@ class Scylla:
                 logger.warning(f"⚠️  Failed to start dribbler motor: {e}")
         
         try:
-            while not self.events['stop'].is_set():
+            stop_evt = self.stop_evt
+            while not stop_evt.is_set():
                 self._update()
         except KeyboardInterrupt:
             print("\nScylla interrupted by user (Ctrl+C)")
@@ -452,8 +757,16 @@ class Scylla:
     
     def _start_always_on_processes(self):
         """Start processes that should always be running (like button input)"""
-        # Button poller (always on to detect pause/emergency stop)
+        # Button poller (always on to detect pause/emergency stop). With no
+        # buttons configured there is nothing to wait for - don't park a thread.
+        if not self.config.get('buttons'):
+            print("Warning: No buttons configured. Button input disabled.")
+            return
+        
         self.button_stop_evt = ThreadEvent()
+        # Created here, not in the thread, so shutdown() can always wake it
+        self._button_pending = queue.SimpleQueue()
+        self._button_ready = ThreadEvent()
         self.button_thread = Thread(
             target=self._button_poller,
             args=(self.button_stop_evt, self.queues['button_out']),
@@ -464,65 +777,70 @@ class Scylla:
     def _update(self):
         """Main update loop - runs every iteration"""
         try:
-            current_time = time.time()
-            state_cfg = self.STATE_CONFIGS[self.current_state]
+            now_ns = time.monotonic_ns()
+            state_handler, _, _, state_cfg, polls = self._current
             
-            # Calculate target delta based on state's update rate
-            target_dt = 1.0 / state_cfg.update_rate_hz
-            
-            # Check if enough time has passed for this state's update rate
-            if current_time - self.last_update_time < target_dt:
-                time.sleep(0.001)  # small sleep to avoid busy-wait
+            # Not due yet: block until an input queue has data or the tick is due.
+            # Whatever woke us is consumed now so the next select doesn't spin on it.
+            remaining_ns = state_cfg.target_dt_ns - (now_ns - self.last_update_ns)
+            if remaining_ns > 0:
+                for key, _ in self._selector.select(timeout=remaining_ns / 1e9):
+                    key.data()
                 return
             
-            self.last_update_time = current_time
-            
-            # Manage resources based on current state needs
-            self._manage_resources(state_cfg)
+            self.last_update_ns = now_ns
             
-            # Gather sensor data if state needs it
-            if state_cfg.needs_camera:
-                self._poll_camera_data()
+            # Gather the sensor data this state needs (resolved per state up front)
+            for poll in polls:
+                poll()
             
-            if state_cfg.needs_localization:
-                self._poll_localization_data()
-            
-            # Always poll button input (for emergency stop, pause, etc.)
-            self._poll_button_input()
+            # Always check input queues (button: emergency stop, pause, etc.) -
+            # one zero-timeout select tells us which have data, only those are read
+            for key, _ in self._selector.select(timeout=0):
+                key.data()
             
             # Dispatch to current state handler
-            state_handler = self._get_state_handler(self.current_state)
             if state_handler:
                 state_handler()
         except Exception as e:
             # Catch any exception in state handlers or update loop
-            logger.error(f"Error in _update() for state {self.current_state.name}: {e}", exc_info=True)
+            logger.error("Error in _update() for state %s: %s", self.current_state.name, e, exc_info=True)
             # Stop motors immediately for safety
             if self.motor_controller:
                 try:
                     self.motor_controller.stop()
                     logger.info("Motors stopped due to error")
-                except:
+                except Exception:
                     pass
             # Re-raise to trigger main loop exception handler
             raise
     
     def _manage_resources(self, state_cfg: StateConfig):
-        """Start/stop processes based on state needs"""
-        # Camera
-        if state_cfg.needs_camera and 'camera' not in self.processes:
+        """
+        Start/stop processes based on state needs
+        
+        Called from transition_to - resources only change when the state does.
+        """
+        # Camera (persistent process - just switched on/off)
+        if state_cfg.needs_camera:
             self._start_camera_process()
-        elif not state_cfg.needs_camera and 'camera' in self.processes:
+        else:
             self._stop_camera_process()
         
-        # Localization
-        if state_cfg.needs_localization and 'localization' not in self.processes:
+        # Localization (same persistent pattern)
+        if state_cfg.needs_localization:
             self._start_localization_process()
-        elif not state_cfg.needs_localization and 'localization' in self.processes:
+        else:
             self._stop_localization_process()
     
-    def _start_camera_process(self):
-        """Start the camera process"""
+    def _launch_camera_process(self):
+        """
+        Launch the camera process once, for the lifetime of Scylla
+        
+        It opens the camera and then idles until camera_active is set, so
+        states can switch vision on/off without respawning the process or
+        re-initializing the sensor. It exits when the global stop event is set.
+        """
         if not CAMERA_AVAILABLE:
             logger.warning("Camera module not available - cannot start camera process")
             return
@@ -530,72 +848,110 @@ class Scylla:
         from hypemage.camera import start as camera_start
         
         proc = self.ctx.Process(
-            target=camera_start,
+            target=_run_pinned,
             args=(
+                self._affinity.get('camera'),
+                camera_start,
                 self.queues['camera_cmd'],
-                self.queues['camera_out'],
-                self.events['camera_active'],
-                self.config.get('camera', None)
+                self.camera_ring,
+                self.events['stop'],
+                self.config.get('camera', None),
+                self.events['camera_detect_ball'],
+                self.events['camera_active']
             )
         )
         proc.start()
         self.processes['camera'] = proc
+        self.status.camera = True
         print("Camera process started")
     
+    def _start_camera_process(self):
+        """Switch camera capture on"""
+        if 'camera' in self.processes and not self.camera_active_evt.is_set():
+            self.camera_active_evt.set()
+            print("Camera active")
+    
     def _stop_camera_process(self):
-        """Stop the camera process"""
-        if 'camera' in self.processes:
-            self.queues['camera_cmd'].put({'type': 'stop'})
-            self.events['camera_active'].set()
-            self.processes['camera'].join(timeout=2)
-            if self.processes['camera'].is_alive():
-                self.processes['camera'].terminate()
-            del self.processes['camera']
-            print("Camera process stopped")
+        """Switch camera capture off (the process stays up)"""
+        if self.camera_active_evt.is_set():
+            self.camera_active_evt.clear()
+            print("Camera idle")
     
-    def _start_localization_process(self):
-        """Start the localization process"""
+    def _launch_localization_process(self):
+        """
+        Launch the localization process once, for the lifetime of Scylla
+        
+        Like the camera it idles until loc_active is set, so states that don't
+        need localization never pay for a respawn when they hand back to one
+        that does.
+        """
         # Import your localization start function
         # from mproc.localization import start as loc_start
         
         # For now, a stub
-        # proc = self.ctx.Process(target=loc_start, args=(...))
+        # proc = self.ctx.Process(target=_run_pinned,
+        #                         args=(self._affinity.get('localization'), loc_start,
+        #                               self.queues['loc_cmd'], self.queues['loc_out'], self.stop_evt,
+        #                               self.events['loc_active']))
         # proc.start()
         # self.processes['localization'] = proc
+        # self.status.localization = True
     
-    def _stop_localization_process(self):
-        """Stop the localization process"""
-        if 'localization' in self.processes:
+    def _start_localization_process(self):
+        """Switch localization on"""
+        if 'localization' in self.processes and not self.events['loc_active'].is_set():
             self.events['loc_active'].set()
-            self.processes['localization'].join(timeout=2)
-            if self.processes['localization'].is_alive():
-                self.processes['localization'].terminate()
-            del self.processes['localization']
+            print("Localization active")
+    
+    def _stop_localization_process(self):
+        """Switch localization off (the process stays up)"""
+        if self.events['loc_active'].is_set():
+            self.events['loc_active'].clear()
+            print("Localization idle")
     
     def _poll_camera_data(self):
-        """Get latest camera data from queue (non-blocking)"""
+        """Get latest camera data from the shared-memory ring (non-blocking)"""
+        if self.camera_ring is None:
+            return
+        vision_data = self.camera_ring.get_latest()
+        self._camera_data_fresh = vision_data is not None
+        if vision_data is not None:
+            self.latest_camera_data = vision_data
+    
+    @staticmethod
+    def _drain_latest(q):
+        """
+        Empty a queue without blocking and return the newest item (None if empty)
+        
+        Reads until queue.Empty rather than checking empty() before every get,
+        which takes the queue's lock twice per item and can race the producer.
+        """
+        latest = None
         try:
-            while not self.queues['camera_out'].empty():
-                self.latest_camera_data = self.queues['camera_out'].get_nowait()
-        except:
+            while True:
+                latest = q.get_nowait()
+        except queue.Empty:
             pass
+        return latest
     
     def _poll_localization_data(self):
         """Get latest localization data from queue (non-blocking)"""
-        try:
-            while not self.queues['loc_out'].empty():
-                self.latest_localization_data = self.queues['loc_out'].get_nowait()
-        except:
-            pass
+        loc_data = self._drain_latest(self.queues['loc_out'])
+        if loc_data is not None:
+            self.latest_localization_data = loc_data
     
     def _poll_button_input(self):
-        """Get latest button input from queue (non-blocking)"""
-        try:
-            while not self.queues['button_out'].empty():
-                self.latest_button_input = self.queues['button_out'].get_nowait()
-                self._handle_button_input(self.latest_button_input)
-        except:
-            pass
+        """
+        Handle all pending button input (non-blocking)
+        
+        Unlike sensor data every press matters here (each one toggles pause),
+        so events are handled in order rather than reduced to the latest.
+        """
+        button_q = self.button_q
+        # Single consumer, so empty() (a poll on the pipe) can't race another get()
+        while not button_q.empty():
+            self.latest_button_input = button_q.get()
+            self._handle_button_input(self.latest_button_input)
     
     def _handle_button_input(self, event):
         """
@@ -627,31 +983,29 @@ class Scylla:
                 'emergency_stop': board.D19,   # Also triggers pause
                 'toggle_mode': board.D26       # Also triggers pause
             }
-        """
-        import digitalio
         
+        Uses lgpio edge alerts when available (the thread sleeps until a press),
+        otherwise polls the pins through digitalio.
+        """
         # Get button configuration
         button_config = self.config.get('buttons', {})
         
-        if not button_config:
-            print("Warning: No buttons configured. Button poller running in stub mode.")
-            # Stub mode - just wait
-            while not stop_evt.is_set():
-                time.sleep(0.1)
+        if _HAS_LGPIO:
+            try:
+                self._wait_for_button_edges(button_config, stop_evt, button_q)
+                return
+            except Exception as e:
+                print(f"Warning: GPIO edge alerts unavailable ({e}), falling back to polling")
+        
+        if not _HAS_BOARD:
+            print("Warning: board module not available. Button poller disabled.")
+            self._button_ready.set()
             return
         
         # Initialize buttons
         buttons = {}
         button_states = {}  # Track last press times for debouncing
         
-        try:
-            import board  # noqa: F401 - imported for pin definitions passed in config
-        except ImportError:
-            print("Warning: board module not available. Button poller disabled.")
-            while not stop_evt.is_set():
-                time.sleep(0.1)
-            return
-        
         # Set up each button
         for action_name, pin in button_config.items():
             try:
@@ -667,6 +1021,7 @@ class Scylla:
                 print(f"Button '{action_name}' configured on pin {pin}")
             except Exception as e:
                 print(f"Failed to initialize button '{action_name}' on pin {pin}: {e}")
+        self._button_ready.set()
         
         # Poll loop
         while not stop_evt.is_set():
@@ -689,15 +1044,63 @@ class Scylla:
                             'action': action_name,
                             'timestamp': current_time
                         }
-                        try:
-                            button_q.put(event, block=False)
-                        except Exception:
-                            pass  # Queue full, drop event
+                        button_q.put(event)
                 else:
                     # Button is released
                     state['last_up'] = current_time
             
-            time.sleep(0.05)  # Poll at ~50 Hz
+            # Poll at ~20 Hz; waiting on the stop event (rather than sleeping)
+            # lets shutdown wake the thread immediately
+            stop_evt.wait(0.05)
+    
+    def _wait_for_button_edges(self, button_config, stop_evt, button_q):
+        """
+        Deliver button presses from lgpio falling-edge alerts until stop_evt is set
+        
+        Buttons are active low with pull-ups; debouncing is done by lgpio.
+        Pins may be board pins (their .id is the BCM number) or plain ints.
+        
+        The alert callbacks run on lgpio's thread, and button_q.put() can block
+        once its pipe is full. So the callbacks only hand the press to an
+        in-process queue.SimpleQueue (put never blocks) and this thread does the
+        pipe write. shutdown() puts a None sentinel to end the loop.
+        """
+        chip = lgpio.gpiochip_open(self.config.get('gpio_chip', 0))
+        callbacks = []
+        pending = self._button_pending
+        
+        def make_callback(action_name):
+            def on_press(chip, gpio, level, tick):
+                pending.put((action_name, time.monotonic()))
+            return on_press
+        
+        try:
+            for action_name, pin in button_config.items():
+                gpio = getattr(pin, 'id', pin)
+                lgpio.gpio_claim_alert(chip, gpio, lgpio.FALLING_EDGE, lgpio.SET_PULL_UP)
+                lgpio.gpio_set_debounce_micros(chip, gpio, 50_000)
+                callbacks.append(lgpio.callback(chip, gpio, lgpio.FALLING_EDGE,
+                                                make_callback(action_name)))
+                print(f"Button '{action_name}' configured on GPIO {gpio} (edge alerts)")
+            self._button_ready.set()  # lgpio's callback thread is up
+            
+            # Forward presses from lgpio's thread until the shutdown sentinel
+            # (stop_evt is set before it, so a stop during setup is seen too)
+            while not stop_evt.is_set():
+                item = pending.get()
+                if item is None:
+                    break
+                action_name, timestamp = item
+                event = {
+                    'type': 'button_press',
+                    'action': action_name,
+                    'timestamp': timestamp
+                }
+                button_q.put(event)
+        finally:
+            for cb in callbacks:
+                cb.cancel()
+            lgpio.gpiochip_close(chip)
     
     # ==================== BUTTON ACTION HANDLERS ====================
     
@@ -727,31 +1130,18 @@ class Scylla:
         """
         Backup state-specific variables before pausing
         
-        Stores all instance variables that start with '_' (state variables)
-        into _pause_state_backup for later restoration
+        Stores the state variables listed in _STATE_VARS into
+        _pause_state_backup for later restoration
         """
         self._pause_state_backup.clear()
         
-        # Get all state-specific variables (those starting with state name or common patterns)
-        state_var_patterns = [
-            '_search_',
-            '_square_',
-            '_lineup_',
-            '_defend_',
-            '_attack_'
-        ]
-        
-        for attr_name in dir(self):
-            # Check if it's a state variable
-            if any(attr_name.startswith(pattern) for pattern in state_var_patterns):
-                try:
-                    value = getattr(self, attr_name)
-                    # Only backup data attributes, not methods
-                    if not callable(value):
-                        self._pause_state_backup[attr_name] = value
-                        logger.debug(f"Backed up state variable: {attr_name}")
-                except AttributeError:
-                    pass
+        for attr_name in self._STATE_VARS:
+            try:
+                self._pause_state_backup[attr_name] = getattr(self, attr_name)
+                logger.debug("Backed up state variable: %s", attr_name)
+            except AttributeError:
+                # Slot not assigned yet (state never entered)
+                pass
     
     def _restore_state_vars(self):
         """
@@ -762,9 +1152,9 @@ class Scylla:
         for attr_name, value in self._pause_state_backup.items():
             try:
                 setattr(self, attr_name, value)
-                logger.debug(f"Restored state variable: {attr_name}")
+                logger.debug("Restored state variable: %s", attr_name)
             except Exception as e:
-                logger.warning(f"Failed to restore {attr_name}: {e}")
+                logger.warning("Failed to restore %s: %s", attr_name, e)
         
         # Clear the backup after restoration
         self._pause_state_backup.clear()
@@ -798,14 +1188,15 @@ class Scylla:
                 speed = self.config.get('dribbler', {}).get('default_speed', 0.5)
             self.dribbler_controller.enable(speed)
         else:
-            logger.warning("Dribbler controller not available")
+            # Called every chase tick - init already warned that it's missing
+            logger.debug("Dribbler controller not available")
     
     def disable_dribbler(self):
         """Stop the dribbler motor"""
         if self.dribbler_controller:
             self.dribbler_controller.stop()
         else:
-            logger.warning("Dribbler controller not available")
+            logger.debug("Dribbler controller not available")
     
     def kick(self, duration: float = None) -> bool:
         """
@@ -845,7 +1236,7 @@ class Scylla:
         print(f"Transitioning: {self.current_state.name} -> {new_state.name}")
         
         # Call exit handler for current state
-        exit_handler = self._get_exit_handler(self.current_state)
+        exit_handler = self._current[2]
         if exit_handler:
             exit_handler()
         
@@ -853,25 +1244,41 @@ class Scylla:
         self.previous_state = self.current_state
         self.current_state = new_state
         
+        # Start/stop processes for the new state before it runs
+        self._current = self._handlers[new_state]
+        _, enter_handler, _, new_cfg, _ = self._current
+        self._manage_resources(new_cfg)
+        
         # Call enter handler for new state
-        enter_handler = self._get_enter_handler(new_state)
         if enter_handler:
             enter_handler()
     
-    def _get_state_handler(self, state: State) -> Optional[Callable]:
-        """Get the handler function for a state"""
-        handler_name = f"state_{state.name.lower()}"
-        return getattr(self, handler_name, None)
-    
-    def _get_enter_handler(self, state: State) -> Optional[Callable]:
-        """Get the on-enter handler for a state"""
-        handler_name = f"on_enter_{state.name.lower()}"
-        return getattr(self, handler_name, None)
-    
-    def _get_exit_handler(self, state: State) -> Optional[Callable]:
-        """Get the on-exit handler for a state"""
-        handler_name = f"on_exit_{state.name.lower()}"
-        return getattr(self, handler_name, None)
+    def _build_handler_table(self) -> Dict[State, Tuple[Optional[Callable], Optional[Callable],
+                                                        Optional[Callable], StateConfig,
+                                                        Tuple[Callable, ...]]]:
+        """
+        Resolve every state's handlers once at startup
+        
+        Handlers are found by name (state_<name>, on_enter_<name>, on_exit_<name>),
+        missing ones are None. The last entry is the state's sensor polls, picked
+        from its needs_* flags, so the tick doesn't re-test constant flags
+        (localization arrives through the selector, not a per-tick poll).
+        """
+        table = {}
+        for state in State:
+            name = state.name.lower()
+            cfg = self.STATE_CONFIGS[state]
+            polls = []
+            if cfg.needs_camera:
+                polls.append(self._poll_camera_data)
+            table[state] = (
+                getattr(self, f"state_{name}", None),
+                getattr(self, f"on_enter_{name}", None),
+                getattr(self, f"on_exit_{name}", None),
+                cfg,
+                tuple(polls),
+            )
+        return table
     
     # ==================== STATE HANDLERS ====================
     
@@ -892,7 +1299,7 @@ class Scylla:
         
         # Could display debug info, wait for unpause
         if self.latest_camera_data:
-            print(f"[PAUSED] Camera frame {self.latest_camera_data.frame_id} available")
+            logger.debug("[PAUSED] Camera frame %d available", self.latest_camera_data.frame_id)
     
     def state_chase_ball(self):
         """
@@ -903,93 +1310,59 @@ class Scylla:
         if self._is_paused:
             return
         
-        if not self.latest_camera_data:
+        # Only react to a new frame - recomputing the last one would send the
+        # same commands again. If frames stop coming, the motor watchdog stops
+        # the robot once no command has arrived for watchdog_timeout.
+        if not self._camera_data_fresh:
             return
         
-        ball = self.latest_camera_data.ball
+        # Bind hot attributes to locals once per tick
+        camera_data = self.latest_camera_data
+        ball = camera_data.ball
+        motor_controller = self.motor_controller
         
         if ball.detected:
             # Track if ball is close and enable dribbler accordingly
             if ball.is_close:
                 self._last_ball_was_close = True
-                # Enable dribbler at speed 1.8 when ball is close
-                self.enable_dribbler(speed=1.8)
+                # Enable dribbler when ball is close
+                self.enable_dribbler(speed=self.CHASE_DRIBBLER_SPEED)
             else:
                 self._last_ball_was_close = False
                 # Disable dribbler when ball is not close
                 self.disable_dribbler()
             
-            if self.motor_controller:
+            if motor_controller:
                 # Use ball angle directly to move towards it
                 # ball.angle: 0° = forward, positive = counterclockwise (left), negative = clockwise (right)
                 
-                base_speed = 0.07
                 movement_angle = ball.angle
                 
                 # Move in the direction of the ball
                 try:
-                    self.motor_controller.move_robot_relative(
+                    motor_controller.move_robot_relative(
                         angle=movement_angle,  # Move directly towards ball angle
-                        speed=base_speed,
+                        speed=self.CHASE_SPEED,
                         rotation=0.0  # No rotation, just move towards ball
                     )
                     
-                    # Determine general direction for display
-                    if -22.5 <= movement_angle <= 22.5:
-                        direction = "FORWARD"
-                    elif 22.5 < movement_angle <= 67.5:
-                        direction = "FORWARD-LEFT"
-                    elif 67.5 < movement_angle <= 112.5:
-                        direction = "LEFT"
-                    elif 112.5 < movement_angle <= 157.5:
-                        direction = "BACK-LEFT"
-                    elif 157.5 < movement_angle or movement_angle <= -157.5:
-                        direction = "BACKWARD"
-                    elif -157.5 < movement_angle <= -112.5:
-                        direction = "BACK-RIGHT"
-                    elif -112.5 < movement_angle <= -67.5:
-                        direction = "RIGHT"
-                    elif -67.5 < movement_angle <= -22.5:
-                        direction = "FORWARD-RIGHT"
-                    else:
-                        direction = "UNKNOWN"
-                    
-                    # Color codes for terminal output
-                    GREEN = '\033[92m'  # Bright green
-                    YELLOW = '\033[93m'  # Bright yellow
-                    BLUE = '\033[94m'   # Bright blue
-                    MAGENTA = '\033[95m'  # Bright magenta
-                    CYAN = '\033[96m'   # Bright cyan
-                    WHITE = '\033[97m'  # Bright white
-                    BOLD = '\033[1m'    # Bold
-                    RESET = '\033[0m'   # Reset to normal
-                    
-                    # Choose color based on direction
-                    if direction == "FORWARD":
-                        color = GREEN
-                    elif "LEFT" in direction:
-                        color = YELLOW
-                    elif "RIGHT" in direction:
-                        color = BLUE
-                    elif "BACK" in direction:
-                        color = MAGENTA
-                    else:
-                        color = CYAN
-                    
-                    print(f"{BOLD}{color}[CHASE] Moving {direction} (angle={movement_angle:.1f}°){RESET}")
+                    # Per-tick trace: only built when DEBUG logging is on
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[CHASE] Moving %s (angle=%.1f°)",
+                                     _direction_label(movement_angle), movement_angle)
                 except Exception as e:
-                    self.motor_controller.stop()
+                    motor_controller.stop()
             else:
                 pass
         else:
             # Ball not detected - do nothing, just wait
             # Keep dribbler on if last seen ball was close (might have it in dribbler)
             if self._last_ball_was_close:
-                self.enable_dribbler(speed=1.8)
+                self.enable_dribbler(speed=self.CHASE_DRIBBLER_SPEED)
             
             # Stop motors when ball is not found
-            if self.motor_controller:
-                self.motor_controller.stop()
+            if motor_controller:
+                motor_controller.stop()
     
     def state_defend_goal(self):
         """Defensive positioning"""
@@ -1001,7 +1374,7 @@ class Scylla:
             return
         
         # Use localization to position between ball and own goal
-        print(f"Defending... pos={self.latest_localization_data}")
+        logger.debug("Defending... pos=%s", self.latest_localization_data)
     
     def state_attack_goal(self):
         """Attacking - move ball toward opponent goal"""
@@ -1009,14 +1382,15 @@ class Scylla:
         if self._is_paused:
             return
         
-        if not self.latest_camera_data:
+        camera_data = self.latest_camera_data
+        if not camera_data:
             return
         
-        ball = self.latest_camera_data.ball
-        yellow_goal = self.latest_camera_data.yellow_goal  # or blue, depending on team
+        ball = camera_data.ball
+        yellow_goal = camera_data.yellow_goal  # or blue, depending on team
         
         if ball.detected and yellow_goal.detected:
-            print(f"Attack: ball={ball.detected}, goal={yellow_goal.detected}")
+            logger.debug("Attack: ball=%s, goal=%s", ball.detected, yellow_goal.detected)
             # Logic to push ball toward goal
     
     
@@ -1026,10 +1400,11 @@ class Scylla:
         if self._is_paused:
             return
         
-        if not self.latest_camera_data:
+        camera_data = self.latest_camera_data
+        if not camera_data:
             return
         
-        ball = self.latest_camera_data.ball
+        ball = camera_data.ball
         if ball.detected and ball.is_close_and_centered:
             # Ball is in position - kick it!
             if self.can_kick():
@@ -1058,14 +1433,14 @@ class Scylla:
             return
         
         # Send stop command to motors
-        print("STOPPED - press 'p' to unpause")
+        logger.debug("STOPPED - press 'p' to unpause")
     
     def state_move_in_square(self):
         """
         Example state: Move in a square pattern using robot-relative movement
         
         This demonstrates:
-        - Using move_robot_relative() for directional movement
+        - Using move_robot_vector() with precomputed directions for movement
         - State transitions based on timing
         - Simple movement pattern without camera/localization
         
@@ -1075,41 +1450,28 @@ class Scylla:
         if self._is_paused:
             return
         
-        # Initialize state variables on first entry (using hasattr to check)
-        if not hasattr(self, '_square_state_init'):
-            self._square_state_init = True
-            self._square_step = 0  # 0=forward, 1=left, 2=back, 3=right
-            self._square_start_time = time.time()
-            self._square_step_duration = 1.0  # 1 second per side
-            self._square_speed = 0.05
-        
         # Calculate which step we're on
-        elapsed = time.time() - self._square_start_time
+        now_ns = time.monotonic_ns()
+        step = self._square_step
         
         # Check if we need to move to next step
-        if elapsed > self._square_step_duration:
-            self._square_step = (self._square_step + 1) % 4  # Cycle through 0-3
-            self._square_start_time = time.time()
-            logger.info(f"Square movement: step {self._square_step}")
-        
-        # Execute movement based on current step
-        if not self.motor_controller:
-            logger.warning("No motor controller - cannot move in square")
+        if now_ns - self._square_start_ns > self._square_step_duration_ns:
+            step = self._square_step = (step + 1) & self._SQUARE_MASK  # Cycle through 0-3
+            self._square_start_ns = now_ns
+            logger.info("Square movement: step %d (direction %d°, speed %s)",
+                        step, self.SQUARE_DIRECTIONS[step], self._square_speed)
+        
+        # Execute movement based on current step (missing controller is
+        # reported once, on entry)
+        move = self._square_move
+        if move is None:
             return
         
-        # Map step to direction:
-        # 0 = forward (0°), 1 = left (270°), 2 = back (180°), 3 = right (90°)
-        directions = [0, 270, 180, 90]
-        current_direction = directions[self._square_step]
+        forward, left = self.SQUARE_VECTORS[step]
+        speed = self._square_speed
         
         # Move in current direction
-        self.motor_controller.move_robot_relative(
-            angle=current_direction,
-            speed=self._square_speed,
-            rotation=0.0
-        )
-        
-        print(f"[SQUARE] Step {self._square_step}, Direction {current_direction}°, Speed {self._square_speed}")
+        move(forward * speed, left * speed, 0.0)
     
     def state_move_straight(self):
         """
@@ -1123,7 +1485,6 @@ class Scylla:
             return
         
         if not self.motor_controller:
-            logger.warning("No motor controller - cannot move straight")
             return
         
         # Move forward
@@ -1133,8 +1494,6 @@ class Scylla:
             speed=forward_speed,
             rotation=0.0  # No rotation
         )
-        
-        print(f"[STRAIGHT] Moving forward at {forward_speed*100:.0f}% speed")
     
     # ==================== STATE ENTER/EXIT HOOKS ====================
     
@@ -1143,38 +1502,80 @@ class Scylla:
         # Reset ball tracking state
         self._last_ball_was_close = False
         
-        # Could send camera command to prioritize ball detection
-        self.queues['camera_cmd'].put({'type': 'detect_ball'})
+        # Have the camera prioritize ball detection while chasing
+        self.camera_detect_ball_evt.set()
     
     def on_exit_chase_ball(self):
         """Called when exiting chase_ball state"""
         # Disable dribbler when exiting chase
         self.disable_dribbler()
+        self.camera_detect_ball_evt.clear()
+    
     
+    def on_enter_move_in_square(self):
+        """Called when entering move_in_square state"""
+        if not self.motor_controller:
+            logger.warning("No motor controller - cannot move in square")
+        self._square_step = 0  # 0=forward, 1=left, 2=back, 3=right
+        self._square_start_ns = time.monotonic_ns()
+        self._square_step_duration_ns = 1_000_000_000  # 1 second per side
+        self._square_speed = 0.05
+        # Bound once here instead of walking self.motor_controller.<method> every tick
+        self._square_move = self.motor_controller.move_robot_vector if self.motor_controller else None
     
     def on_exit_move_in_square(self):
         """Called when exiting move_in_square state"""
         logger.info("Exiting MOVE_IN_SQUARE mode")
-        # Clean up square state variables
-        if hasattr(self, '_square_state_init'):
-            delattr(self, '_square_state_init')
-        if hasattr(self, '_square_step'):
-            delattr(self, '_square_step')
-        if hasattr(self, '_square_start_time'):
-            delattr(self, '_square_start_time')
-        if hasattr(self, '_square_step_duration'):
-            delattr(self, '_square_step_duration')
-        if hasattr(self, '_square_speed'):
-            delattr(self, '_square_speed')
+        if self.motor_controller:
+            self.motor_controller.stop()
+        # Reset square state variables (seeded again on next entry)
+        self._square_step = 0
+        self._square_start_ns = 0
+        self._square_step_duration_ns = 0
+        self._square_speed = 0.0
+        self._square_move = None
+    
+    def on_enter_move_straight(self):
+        """Called when entering move_straight state"""
+        if not self.motor_controller:
+            logger.warning("No motor controller - cannot move straight")
+        else:
+            logger.info("[STRAIGHT] Moving forward")
     
     def on_enter_stopped(self):
         """Called when entering stopped state"""
         print("EMERGENCY STOP ACTIVATED")
-        # Send immediate stop to motors
-        self.queues['motor_cmd'].put({'type': 'stop'})
+        # Send immediate stop to motors (MotorController's in-process command
+        # queue - no IPC or pickling on this path)
+        if self.motor_controller:
+            self.motor_controller.stop()
     
     # ==================== CLEANUP ====================
     
+    def _join_processes(self, timeout: float):
+        """
+        Wait for all child processes to exit within one shared deadline
+        
+        Anything still alive afterwards is terminated (SIGTERM), and killed
+        (SIGKILL) if it ignores that too.
+        """
+        deadline = time.monotonic() + timeout
+        for proc in self.processes.values():
+            proc.join(timeout=max(0.0, deadline - time.monotonic()))
+        
+        stragglers = [(name, proc) for name, proc in self.processes.items() if proc.is_alive()]
+        for name, proc in stragglers:
+            logger.warning("Process %s didn't stop cleanly, terminating...", name)
+            proc.terminate()
+        
+        deadline = time.monotonic() + 0.5
+        for name, proc in stragglers:
+            proc.join(timeout=max(0.0, deadline - time.monotonic()))
+            if proc.is_alive():
+                logger.error("Process %s ignored SIGTERM, killing...", name)
+                proc.kill()
+                proc.join(timeout=0.5)
+    
     def shutdown(self):
         """
         Clean shutdown of all processes and hardware
@@ -1228,36 +1629,38 @@ class Scylla:
                 print(f"⚠️  Warning: Motor stop failed: {e}")
         
         # Stop button thread
-        if hasattr(self, 'button_stop_evt'):
+        if self.button_thread is not None:
             self.button_stop_evt.set()
-            if hasattr(self, 'button_thread'):
-                self.button_thread.join(timeout=1)
+            self._button_pending.put(None)  # wakes the edge-alert forwarder
+            self.button_thread.join(timeout=1)
         
         # Stop all processes
         self._stop_camera_process()
         self._stop_localization_process()
         
         # Signal global stop
-        self.events['stop'].set()
+        self.stop_evt.set()
         
-        # Join any remaining processes
-        for name, proc in self.processes.items():
-            try:
-                proc.join(timeout=1)
-                if proc.is_alive():
-                    logger.warning(f"Process {name} didn't stop cleanly, terminating...")
-                    proc.terminate()
-            except Exception as e:
-                logger.error(f"Error stopping process {name}: {e}")
+        self._selector.close()
+        
+        # Join all processes against one shared deadline (they were all
+        # signalled above, so they stop in parallel - total wait is the
+        # slowest child, not the sum), then escalate on stragglers
+        self._join_processes(timeout=1.0)
+        
+        # Free the camera ring now that nothing is writing to it
+        if self.camera_ring is not None:
+            self.camera_ring.close()
+            self.camera_ring.unlink()
+            self.camera_ring = None
         
         print("✓ Scylla shutdown complete")
 
 
 if __name__ == '__main__':
-    # Example configuration with button mappings
-    try:
-        import board
-        
+    # Example configuration with button mappings (board was probed once at
+    # module import - no second import attempt here)
+    if _HAS_BOARD:
         config = {
             'buttons': {
                 'pause': board.D13,           # Button 1: Pause/Resume
@@ -1268,7 +1671,7 @@ if __name__ == '__main__':
                 # Camera config can go here
             }
         }
-    except ImportError:
+    else:
         print("Warning: board module not available, running without physical buttons")
         config = {}
     
@@ -0,0 +1,49 @@
+"""
+Lock-free boolean flag shared between processes
+
+multiprocessing.Event takes a lock (and a condition variable) on every
+set()/is_set(), which is wasted on a flag that child processes only poll once
+per loop - like the global stop signal.
+
+SharedFlag is a single byte in shared memory (a lock-free ctypes Value):
+set()/clear()/is_set() are plain byte stores/loads.
+
+Usage:
+    stop = SharedFlag(ctx)                  # parent, before spawning
+    proc = ctx.Process(target=camera_start, args=(..., stop))
+
+    stop.set()                              # parent, on shutdown
+    while not stop.is_set(): ...            # child loop
+"""
+
+import ctypes
+import multiprocessing
+
+
+class SharedFlag:
+    """
+    Boolean flag shared between processes, polled without locking
+
+    Drop-in for the set()/clear()/is_set() part of multiprocessing.Event: each
+    call is a single byte store/load instead of taking the Event's lock. There
+    is no wait() - keep an Event where a process actually blocks on the flag.
+    Pass it to children as a Process argument (like a Value, it can't be sent
+    through a Queue).
+    """
+
+    def __init__(self, ctx=None):
+        """
+        Args:
+            ctx: multiprocessing context to allocate from (default: multiprocessing)
+        """
+        ctx = ctx or multiprocessing
+        self._flag = ctx.Value(ctypes.c_uint8, 0, lock=False)
+
+    def set(self):
+        self._flag.value = 1
+
+    def clear(self):
+        self._flag.value = 0
+
+    def is_set(self) -> bool:
+        return self._flag.value != 0
@@ -0,0 +1,270 @@
+"""
+Shared-memory ring buffer for camera -> FSM vision data
+
+The camera process publishes one detection result per frame. Sending those
+through a multiprocessing.Queue pickles every VisionData, pushes it through a
+pipe via a feeder thread, and unpickles it again in Scylla - only for Scylla to
+throw away everything but the newest one.
+
+VisionRing stores the detection results as fixed-size records in a
+SharedMemory block instead:
+
+    [ head (uint64) | slot 0 | slot 1 | ... | slot N-1 ]
+
+- Single producer (camera process), single consumer (Scylla)
+- Producer writes slot ``head & mask`` then publishes ``head + 1``
+- Consumer only ever reads the newest slot, skipping anything older
+- Bounded memory: N slots, no matter how far behind the consumer falls
+
+By default only detection results travel through the ring. Pass frame_shape
+to also give every slot a pre-allocated frame buffer in a second SharedMemory
+block: VisionData.raw_frame is then copied into the slot's buffer (no pickling)
+and handed back by get_latest(). JPEG bytes (frame_bytes) are never carried.
+
+A further step, if frames ever need to skip even that copy: share the capture
+buffers themselves (pass the camera's dmabuf FDs once over a Unix socket with
+socket.send_fds, mmap them read-only) and put only the buffer index in the record.
+
+Usage:
+    ring = VisionRing()                      # parent, before spawning
+    ring = VisionRing(frame_shape=(640, 640, 3))   # ...also carrying raw frames
+    proc = ctx.Process(target=camera_start, args=(cmd_q, ring, stop_evt))
+
+    ring.put(vision_data)                    # camera process (Queue-like)
+    data = ring.get_latest()                 # Scylla: VisionData or None
+    data = ring.get_latest(copy_frame=False) # ...raw_frame as a view, no copy
+
+    ring.close(); ring.unlink()              # parent, on shutdown
+"""
+
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+import numpy as np
+
+from hypemage.camera import VisionData, BallDetectionResult, GoalDetectionResult
+
+
+_BALL_FIELDS = [
+    ('detected', np.bool_),
+    ('center_x', np.int32),
+    ('center_y', np.int32),
+    ('radius', np.int32),
+    ('area', np.float32),
+    ('horizontal_error', np.float32),
+    ('vertical_error', np.float32),
+    ('distance', np.float32),
+    ('angle', np.float32),
+    ('is_close', np.bool_),
+    ('is_centered_horizontally', np.bool_),
+    ('is_close_and_centered', np.bool_),
+    ('in_close_zone', np.bool_),
+]
+
+_GOAL_FIELDS = [
+    ('detected', np.bool_),
+    ('center_x', np.int32),
+    ('center_y', np.int32),
+    ('width', np.int32),
+    ('height', np.int32),
+    ('area', np.float32),
+    ('horizontal_error', np.float32),
+    ('vertical_error', np.float32),
+    ('distance', np.float32),
+    ('angle', np.float32),
+    ('is_centered_horizontally', np.bool_),
+]
+
+# One VisionData record (detections + frame/mirror info, no pixels).
+# mirror_* are stored as -1 when the mirror wasn't detected.
+VISION_DTYPE = np.dtype([
+    ('timestamp', np.float64),
+    ('frame_id', np.int64),
+    ('ball', np.dtype(_BALL_FIELDS, align=True)),
+    ('blue_goal', np.dtype(_GOAL_FIELDS, align=True)),
+    ('yellow_goal', np.dtype(_GOAL_FIELDS, align=True)),
+    ('frame_center_x', np.int32),
+    ('frame_center_y', np.int32),
+    ('mirror_detected', np.bool_),
+    ('mirror_center_x', np.int32),
+    ('mirror_center_y', np.int32),
+    ('mirror_radius', np.int32),
+    ('has_frame', np.bool_),  # raw_frame stored in this slot's frame buffer
+], align=True)
+
+_BALL_NAMES = tuple(name for name, _ in _BALL_FIELDS)
+_GOAL_NAMES = tuple(name for name, _ in _GOAL_FIELDS)
+
+# Head counter lives in its own cache line ahead of the slots
+_HEADER_SIZE = 64
+
+
+class VisionRing:
+    """Single-producer/single-consumer ring of VisionData records in shared memory"""
+
+    def __init__(self, slots: int = 8, frame_shape: Optional[Tuple[int, ...]] = None):
+        """
+        Allocate the shared block(s) (call in the parent, before spawning the camera)
+
+        Args:
+            slots: Number of records to keep (power of two)
+            frame_shape: Optional uint8 frame shape, e.g. (640, 640, 3), to also
+                         carry raw frames (one pre-allocated buffer per slot)
+        """
+        if slots <= 0 or slots & (slots - 1):
+            raise ValueError(f"slots must be a power of two, got {slots}")
+
+        self.slots = slots
+        self.frame_shape = tuple(frame_shape) if frame_shape else None
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=_HEADER_SIZE + slots * VISION_DTYPE.itemsize)
+        self._frame_shm = None
+        if self.frame_shape:
+            self._frame_shm = shared_memory.SharedMemory(
+                create=True, size=slots * int(np.prod(self.frame_shape)))
+        self._owner = True
+        self._attach()
+        self._head[0] = 0
+
+    def _attach(self):
+        """Build the numpy views over the shared block(s)"""
+        self._mask = self.slots - 1
+        self._head = np.ndarray((1,), dtype=np.uint64, buffer=self._shm.buf)
+        self._records = np.ndarray((self.slots,), dtype=VISION_DTYPE,
+                                   buffer=self._shm.buf, offset=_HEADER_SIZE)
+        self._frames = None
+        if self._frame_shm is not None:
+            self._frames = np.ndarray((self.slots,) + self.frame_shape, dtype=np.uint8,
+                                      buffer=self._frame_shm.buf)
+        self._last_seq = 0
+
+    def __getstate__(self):
+        # Only the block names cross the process boundary
+        return {'name': self._shm.name, 'slots': self.slots, 'frame_shape': self.frame_shape,
+                'frame_name': self._frame_shm.name if self._frame_shm is not None else None}
+
+    def __setstate__(self, state):
+        self.slots = state['slots']
+        self.frame_shape = state['frame_shape']
+        self._shm = shared_memory.SharedMemory(name=state['name'])
+        self._frame_shm = None
+        if state['frame_name']:
+            self._frame_shm = shared_memory.SharedMemory(name=state['frame_name'])
+        self._owner = False
+        self._attach()
+
+    # ---------------------------------------------------------------- producer
+
+    def put(self, vision_data: VisionData, block: bool = False):
+        """
+        Publish a VisionData record (never blocks - the oldest slot is overwritten)
+
+        Same call shape as Queue.put so camera_start can use either.
+        """
+        head = int(self._head[0])
+        idx = head & self._mask
+        rec = self._records[idx]
+
+        rec['timestamp'] = vision_data.timestamp
+        rec['frame_id'] = vision_data.frame_id
+
+        ball, dst = vision_data.ball, rec['ball']
+        for name in _BALL_NAMES:
+            dst[name] = getattr(ball, name)
+        for key in ('blue_goal', 'yellow_goal'):
+            goal, dst = getattr(vision_data, key), rec[key]
+            for name in _GOAL_NAMES:
+                dst[name] = getattr(goal, name)
+
+        rec['frame_center_x'] = vision_data.frame_center_x
+        rec['frame_center_y'] = vision_data.frame_center_y
+        rec['mirror_detected'] = vision_data.mirror_detected
+        if vision_data.mirror_detected:
+            rec['mirror_center_x'] = vision_data.mirror_center_x
+            rec['mirror_center_y'] = vision_data.mirror_center_y
+            rec['mirror_radius'] = vision_data.mirror_radius
+        else:
+            rec['mirror_center_x'] = rec['mirror_center_y'] = rec['mirror_radius'] = -1
+
+        frame = vision_data.raw_frame
+        has_frame = (self._frames is not None and frame is not None
+                     and frame.shape == self.frame_shape)
+        if has_frame:
+            np.copyto(self._frames[idx], frame)
+        rec['has_frame'] = has_frame
+
+        # Publish only after the slot is fully written
+        self._head[0] = head + 1
+
+    # ---------------------------------------------------------------- consumer
+
+    def get_latest(self, copy_frame: bool = True) -> Optional[VisionData]:
+        """
+        Return the newest record as VisionData, or None if nothing new since
+        the last call. Older unread records are skipped.
+
+        Args:
+            copy_frame: If False, raw_frame is a read-only view straight into the
+                        slot's shared buffer instead of a copy. The view is only
+                        good until the producer comes back round to that slot
+                        (slots - 1 frames later) - copy it if it has to be kept.
+        """
+        head = int(self._head[0])
+        if head == self._last_seq:
+            return None
+
+        idx = (head - 1) & self._mask
+        rec = self._records[idx:idx + 1].copy()[0]
+        frame = None
+        if rec['has_frame']:
+            if copy_frame:
+                frame = self._frames[idx].copy()
+            else:
+                frame = self._frames[idx].view()
+                frame.flags.writeable = False
+
+        # If the producer came back round to this slot while we copied it,
+        # the record may be torn - drop it, the next poll gets a fresh one
+        if int(self._head[0]) - head >= self.slots - 1:
+            return None
+
+        self._last_seq = head
+        vision_data = _record_to_vision_data(rec)
+        vision_data.raw_frame = frame
+        return vision_data
+
+    # ---------------------------------------------------------------- lifetime
+
+    def close(self):
+        """Release this process's mapping of the shared block"""
+        # Drop numpy views first, SharedMemory can't close while they export the buffer
+        self._head = self._records = self._frames = None
+        self._shm.close()
+        if self._frame_shm is not None:
+            self._frame_shm.close()
+
+    def unlink(self):
+        """Free the shared block(s) (owner only, after all users have closed them)"""
+        if self._owner:
+            self._shm.unlink()
+            if self._frame_shm is not None:
+                self._frame_shm.unlink()
+
+
+def _record_to_vision_data(rec) -> VisionData:
+    """Unpack one VISION_DTYPE record into VisionData"""
+    ball = rec['ball']
+    vision_data = VisionData(
+        timestamp=float(rec['timestamp']),
+        frame_id=int(rec['frame_id']),
+        ball=BallDetectionResult(**{name: ball[name].item() for name in _BALL_NAMES}),
+        blue_goal=GoalDetectionResult(**{name: rec['blue_goal'][name].item() for name in _GOAL_NAMES}),
+        yellow_goal=GoalDetectionResult(**{name: rec['yellow_goal'][name].item() for name in _GOAL_NAMES}),
+        frame_center_x=int(rec['frame_center_x']),
+        frame_center_y=int(rec['frame_center_y']),
+        mirror_detected=bool(rec['mirror_detected']),
+    )
+    if vision_data.mirror_detected:
+        vision_data.mirror_center_x = int(rec['mirror_center_x'])
+        vision_data.mirror_center_y = int(rec['mirror_center_y'])
+        vision_data.mirror_radius = int(rec['mirror_radius'])
+    return vision_data